@@ -1,21 +1,38 @@
+import os
+import sys
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from .graph import CSRGraph
+
 from .networks import (
     create_1d_lattice,
     create_2d_lattice,
     create_3d_lattice,
-    create_random_network
+    create_random_network,
+    sample_gnp_edges
 )
 
 from .analysis import (
     calculate_average_shortest_path,
+    estimate_average_shortest_path,
+    exact_average_shortest_path,
     run_simulation,
     calculate_scaling_exponents
 )
 
 from .visualization import plot_scaling_results
 
+from .export import export_figures
+
 from .generative_models import (
+    barabasi_albert_edges,
     barabasi_albert_model,
+    generate_ensemble,
     deterministic_scale_free_construction,
+    degree_statistics,
     analyze_degree_distribution,
     plot_degree_distribution_comparison,
     visualize_networks,
@@ -26,16 +43,24 @@ from .generative_models import (
 )
 
 __all__ = [
+    'CSRGraph',
     'create_1d_lattice',
     'create_2d_lattice',
     'create_3d_lattice',
     'create_random_network',
+    'sample_gnp_edges',
     'calculate_average_shortest_path',
+    'estimate_average_shortest_path',
+    'exact_average_shortest_path',
     'run_simulation',
     'calculate_scaling_exponents',
     'plot_scaling_results',
+    'export_figures',
+    'barabasi_albert_edges',
     'barabasi_albert_model',
+    'generate_ensemble',
     'deterministic_scale_free_construction',
+    'degree_statistics',
     'analyze_degree_distribution',
     'plot_degree_distribution_comparison',
     'visualize_networks',
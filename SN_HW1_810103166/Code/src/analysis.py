@@ -1,87 +1,244 @@
-import networkx as nx
+import json
+import os
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from statistics import NormalDist
 
+from .graph import CSRGraph, distance_histogram
 
-def calculate_average_shortest_path(G, sample_size=5000):
-    if not nx.is_connected(G):
-        largest_cc = max(nx.connected_components(G), key=len)
-        G = G.subgraph(largest_cc).copy()
+
+def _largest_component(G):
+    if not isinstance(G, CSRGraph):
+        G = CSRGraph.from_networkx(G)
+    
+    if G.number_of_nodes() == 0:
+        return G, np.zeros(0, dtype=np.int64)
     
+    _, labels = G.connected_components()
+    return G, np.flatnonzero(labels == np.argmax(np.bincount(labels)))
+
+
+def estimate_average_shortest_path(G, rel_error=0.01, confidence=0.95, min_sources=10,
+                                   max_sources=None, seed=None):
+    G, component = _largest_component(G)
     N = G.number_of_nodes()
+    n = len(component)
     
-    if N <= 1000:
-        return nx.average_shortest_path_length(G)
+    if n < 2:
+        return {'estimate': np.nan, 'stderr': np.nan, 'ci': (np.nan, np.nan),
+                'num_sources': 0, 'exact': False}
     
-    nodes = list(G.nodes())
-    path_lengths = []
+    rng = np.random.default_rng(seed)
+    sources = rng.permutation(component)
+    if max_sources is not None:
+        sources = sources[:max_sources]
     
-    for _ in range(sample_size):
-        source = np.random.choice(nodes)
-        target = np.random.choice(nodes)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    memory_limit = max(1, (1 << 22) // N)
+    batch_size = max(1, min(min_sources, n))
+    
+    count, mean, m2 = 0, 0.0, 0.0
+    stderr = np.inf
+    
+    while count < len(sources):
+        dist = G.distances(sources[count:count + min(batch_size, memory_limit)])
+        dist[np.isinf(dist)] = 0
+        per_source = dist.sum(axis=1) / (n - 1)
         
-        if source != target:
-            try:
-                length = nx.shortest_path_length(G, source, target)
-                path_lengths.append(length)
-            except nx.NetworkXNoPath:
-                continue
+        batch_mean = per_source.mean()
+        batch_m2 = np.sum((per_source - batch_mean) ** 2)
+        total = count + len(per_source)
+        delta = batch_mean - mean
+        mean += delta * len(per_source) / total
+        m2 += batch_m2 + delta ** 2 * count * len(per_source) / total
+        count = total
+        
+        if count > 1:
+            stderr = np.sqrt(m2 / (count - 1) / count * (n - count) / (n - 1))
+        
+        if count >= min(min_sources, n) and z * stderr <= rel_error * mean:
+            break
+        batch_size = max(1, count // 2)
+    
+    if count == 1:
+        stderr = np.nan
+    
+    return {
+        'estimate': mean,
+        'stderr': stderr,
+        'ci': (mean - z * stderr, mean + z * stderr),
+        'num_sources': count,
+        'exact': count == n
+    }
+
+
+def exact_average_shortest_path(G, max_bytes=1 << 26):
+    G, component = _largest_component(G)
+    
+    histogram = distance_histogram(G, component, max_bytes=max_bytes)
+    num_pairs = int(histogram.sum())
+    
+    if num_pairs == 0:
+        average = np.nan
+    else:
+        average = np.dot(np.arange(len(histogram)), histogram) / num_pairs
     
-    return np.mean(path_lengths) if path_lengths else np.nan
+    return {
+        'average': average,
+        'distance_distribution': histogram,
+        'num_pairs': num_pairs,
+        'diameter': len(histogram) - 1
+    }
+
 
+def calculate_average_shortest_path(G, sample_size=5000, rel_error=0.01, seed=None,
+                                    exact=False):
+    if exact:
+        return float(exact_average_shortest_path(G)['average'])
+    
+    result = estimate_average_shortest_path(G, rel_error=rel_error,
+                                            max_sources=sample_size, seed=seed)
+    return float(result['estimate'])
 
-def run_simulation(N_values):
+
+NETWORK_TYPES = ['1D Lattice', '2D Lattice', '3D Lattice', 'Random Network']
+
+
+def _build_network(network_type, N, rng):
     from .networks import (create_1d_lattice, create_2d_lattice, 
                           create_3d_lattice, create_random_network)
     
-    results = {
-        '1D Lattice': {'N': [], 'd': []},
-        '2D Lattice': {'N': [], 'd': []},
-        '3D Lattice': {'N': [], 'd': []},
-        'Random Network': {'N': [], 'd': []}
+    if network_type == '1D Lattice':
+        return create_1d_lattice(N, k=2, backend='csr'), N
+    
+    if network_type == '2D Lattice':
+        if abs(int(np.sqrt(N)) ** 2 - N) >= 100:
+            return None, None
+        return create_2d_lattice(N, backend='csr')
+    
+    if network_type == '3D Lattice':
+        if abs(int(np.cbrt(N)) ** 3 - N) >= 200:
+            return None, None
+        return create_3d_lattice(N, backend='csr')
+    
+    return create_random_network(N, seed=rng, backend='csr'), N
+
+
+def _simulate_point(network_type, N, replicate, seed_sequence, sample_size, seed):
+    rng = np.random.default_rng(seed_sequence)
+    G, actual_N = _build_network(network_type, N, rng)
+    
+    d = None
+    if G is not None and G.is_connected():
+        d = calculate_average_shortest_path(G, sample_size=sample_size, seed=rng)
+    
+    return {
+        'network': network_type,
+        'N': int(N),
+        'replicate': int(replicate),
+        'actual_N': None if actual_N is None else int(actual_N),
+        'd': d,
+        'seed': seed,
+        'sample_size': sample_size
     }
+
+
+def load_simulation_store(path):
+    points = {}
+    if path is None or not os.path.exists(path):
+        return points
     
-    for N in N_values:
-        print(f"Processing N = {N}")
-        
-        G_1d = create_1d_lattice(N, k=2)
-        if nx.is_connected(G_1d):
-            d_1d = calculate_average_shortest_path(G_1d, sample_size=5000)
-            results['1D Lattice']['N'].append(N)
-            results['1D Lattice']['d'].append(d_1d)
-        
-        side_2d = int(np.sqrt(N))
-        actual_N_2d = side_2d ** 2
-        if abs(actual_N_2d - N) < 100:
-            G_2d, actual_N_2d = create_2d_lattice(N)
-            if nx.is_connected(G_2d):
-                d_2d = calculate_average_shortest_path(G_2d, sample_size=5000)
-                results['2D Lattice']['N'].append(actual_N_2d)
-                results['2D Lattice']['d'].append(d_2d)
-        
-        side_3d = int(np.cbrt(N))
-        actual_N_3d = side_3d ** 3
-        if abs(actual_N_3d - N) < 200:
-            G_3d, actual_N_3d = create_3d_lattice(N)
-            if nx.is_connected(G_3d):
-                d_3d = calculate_average_shortest_path(G_3d, sample_size=5000)
-                results['3D Lattice']['N'].append(actual_N_3d)
-                results['3D Lattice']['d'].append(d_3d)
-        
-        G_rn = create_random_network(N)
-        if nx.is_connected(G_rn):
-            d_rn = calculate_average_shortest_path(G_rn, sample_size=5000)
-            results['Random Network']['N'].append(N)
-            results['Random Network']['d'].append(d_rn)
+    with open(path) as f:
+        for line in f:
+            try:
+                point = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            points[(point['network'], point['N'], point['replicate'])] = point
+    
+    return points
+
+
+def _collect_results(points, network_types):
+    results = {network_type: {'N': [], 'actual_N': [], 'd': [], 'd_std': []} for network_type in network_types}
+    
+    grouped = {}
+    for point in points:
+        if point['network'] in results and point['d'] is not None:
+            group = grouped.setdefault((point['network'], point['N']), {'actual_N': point['actual_N'], 'd': []})
+            group['d'].append(point['d'])
+    
+    for (network_type, N), group in sorted(grouped.items(), key=lambda item: item[0][1]):
+        results[network_type]['N'].append(N)
+        results[network_type]['actual_N'].append(group['actual_N'])
+        results[network_type]['d'].append(float(np.mean(group['d'])))
+        results[network_type]['d_std'].append(float(np.std(group['d'])))
     
     return results
 
 
+def run_simulation(N_values, replicates=1, network_types=None, workers=None,
+                   store_path=None, resume=False, seed=None, sample_size=5000, verbose=True):
+    if network_types is None:
+        network_types = NETWORK_TYPES
+    
+    root = np.random.SeedSequence(seed)
+    stored_seed = None if seed is None else root.entropy
+    completed = load_simulation_store(store_path) if resume else {}
+    
+    for point in completed.values():
+        if point.get('seed') != stored_seed or point.get('sample_size') != sample_size:
+            raise ValueError(f"Cannot resume {store_path}: it was written with seed={point.get('seed')} "
+                             f"and sample_size={point.get('sample_size')}")
+    
+    grid = []
+    tasks = []
+    for network_type in network_types:
+        if network_type not in NETWORK_TYPES:
+            raise ValueError(f"Unknown network type: {network_type}")
+        for N in N_values:
+            for replicate in range(replicates):
+                grid.append((network_type, int(N), replicate))
+                if grid[-1] in completed:
+                    continue
+                seed_sequence = np.random.SeedSequence(
+                    root.entropy, spawn_key=(NETWORK_TYPES.index(network_type), int(N), replicate))
+                tasks.append((network_type, int(N), replicate, seed_sequence, sample_size, stored_seed))
+    
+    if store_path is not None:
+        os.makedirs(os.path.dirname(store_path) or '.', exist_ok=True)
+    store = open(store_path, 'a' if resume else 'w') if store_path is not None else None
+    
+    def record(point):
+        completed[(point['network'], point['N'], point['replicate'])] = point
+        if store is not None:
+            store.write(json.dumps(point) + '\n')
+            store.flush()
+        if verbose:
+            print(f"Processed {point['network']} N = {point['N']} (replicate {point['replicate']})")
+    
+    try:
+        if workers == 1 or len(tasks) <= 1:
+            for task in tasks:
+                record(_simulate_point(*task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_simulate_point, *task) for task in tasks]
+                for future in as_completed(futures):
+                    record(future.result())
+    finally:
+        if store is not None:
+            store.close()
+    
+    return _collect_results([completed[key] for key in grid], network_types)
+
+
 def calculate_scaling_exponents(results):
     exponents = {}
     
     for network_type, data in results.items():
         if len(data['N']) > 2:
-            N_arr = np.array(data['N'])
+            N_arr = np.array(data.get('actual_N', data['N']))
             d_arr = np.array(data['d'])
             
             log_N = np.log(N_arr)
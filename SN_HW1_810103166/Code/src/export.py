@@ -0,0 +1 @@
+from sn_common.export import FORMATS, export_figures, spec_hash
\ No newline at end of file
@@ -1,106 +1,252 @@
+import heapq
 import networkx as nx
 import numpy as np
 import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
+from .graph import CSRGraph
+from .layout import cached_layout
+from .networks import as_backend
 
-def barabasi_albert_model(N, m):
+
+def _repeated_targets(rows):
+    order = np.argsort(rows, axis=1, kind='stable')
+    ranked = np.take_along_axis(rows, order, axis=1)
+    repeated = np.zeros_like(rows, dtype=bool)
+    np.put_along_axis(repeated, order[:, 1:], ranked[:, 1:] == ranked[:, :-1], axis=1)
+    return repeated
+
+
+def barabasi_albert_edges(N, m, seed=None):
     if m < 1 or m >= N:
         raise ValueError("m must be between 1 and N-1")
-    G = nx.barabasi_albert_graph(N, m)
-    return G
+    
+    rng = np.random.default_rng(seed)
+    E = m * (N - m)
+    dtype = np.int64
+    
+    sources = np.zeros(E, dtype=dtype)
+    sources[m:] = m + 1 + np.arange(E - m, dtype=dtype) // m
+    targets = np.full(E, -1, dtype=dtype)
+    targets[:m] = np.arange(1, m + 1, dtype=dtype)
+    
+    settled = np.zeros(E, dtype=bool)
+    settled[:m] = True
+    limits = 2 * m * (sources[m:] - m)
+    
+    positions = np.zeros(E, dtype=dtype)
+    waiting = np.arange(m, E)
+    positions[waiting] = rng.integers(limits)
+    
+    while len(waiting):
+        edge = positions[waiting] // 2
+        copied = np.where(settled[edge], targets[edge], -1)
+        targets[waiting] = np.where(positions[waiting] % 2 == 0, sources[edge], copied)
+        known = targets[waiting] >= 0
+        rows = np.unique((waiting[known] - m) // m)
+        waiting = waiting[~known]
+        
+        entries = m + m * rows[:, None] + np.arange(m, dtype=dtype)
+        entries = entries[(targets[entries] >= 0).all(axis=1)]
+        repeated = _repeated_targets(targets[entries])
+        settled[entries[~repeated.any(axis=1)].ravel()] = True
+        
+        redraw = entries[repeated]
+        positions[redraw] = rng.integers(limits[redraw - m])
+        targets[redraw] = -1
+        waiting = np.concatenate([waiting, redraw])
+    
+    return np.column_stack([sources, targets])
+
+
+def barabasi_albert_model(N, m, seed=None, backend='networkx'):
+    G = CSRGraph.from_edges(N, barabasi_albert_edges(N, m, seed))
+    return as_backend(G, backend)
+
+
+def _ensemble_member(N, m, seed_sequence, backend):
+    return barabasi_albert_model(N, m, seed_sequence, backend)
+
+
+def generate_ensemble(N, m, count, seed=None, workers=None, backend='csr'):
+    seeds = np.random.SeedSequence(seed).spawn(count)
+    
+    if workers == 1 or count <= 1:
+        return [_ensemble_member(N, m, s, backend) for s in seeds]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_ensemble_member, [N] * count, [m] * count, seeds, [backend] * count))
+
+
+def _edge_entry(degree, u, v):
+    u, v = min(u, v), max(u, v)
+    return (-(degree[u] + degree[v]), -u, -v)
 
 
 def deterministic_scale_free_construction(iterations):
-    G = nx.Graph()
-    G.add_edges_from([(0, 1), (1, 2), (2, 0)])
-    next_node = 3
+    edges = dict.fromkeys([(0, 1), (1, 2), (0, 2)])
+    degree = [2, 2, 2]
+    
+    heap = [_edge_entry(degree, u, v) for u, v in edges]
+    heapq.heapify(heap)
     
     for iteration in range(iterations):
-        edges = list(G.edges())
-        edge_scores = []
+        while True:
+            score, u, v = heapq.heappop(heap)
+            u, v = -u, -v
+            if (u, v) in edges and degree[u] + degree[v] == -score:
+                break
         
-        for u, v in edges:
-            score = G.degree(u) + G.degree(v)
-            edge_scores.append((score, (u, v)))
+        new_node = len(degree)
+        del edges[(u, v)]
+        edges[(u, new_node)] = None
+        edges[(v, new_node)] = None
+        degree.append(2)
         
-        edge_scores.sort(reverse=True)
-        selected_edge = edge_scores[0][1]
-        u, v = selected_edge
-        
-        new_node = next_node
-        next_node += 1
-        
-        G.remove_edge(u, v)
-        G.add_edge(new_node, u)
-        G.add_edge(new_node, v)
+        heapq.heappush(heap, _edge_entry(degree, u, new_node))
+        heapq.heappush(heap, _edge_entry(degree, v, new_node))
+    
+    G = nx.Graph()
+    G.add_nodes_from(range(len(degree)))
+    G.add_edges_from(edges)
     
     return G
 
 
+def degree_array(G):
+    if isinstance(G, CSRGraph):
+        return G.degree()
+    return np.fromiter((d for _, d in G.degree()), dtype=np.int64, count=G.number_of_nodes())
+
+
+def log_binned_distribution(histogram, num_bins=20):
+    k = np.flatnonzero(histogram)
+    k = k[k > 0]
+    if len(k) == 0:
+        return np.zeros(0), np.zeros(0)
+    
+    edges = np.unique(np.floor(np.logspace(np.log10(k[0]), np.log10(k[-1] + 1), num_bins + 1)))
+    if len(edges) < 2:
+        edges = np.array([k[0], k[0] + 1], dtype=float)
+    
+    totals = np.add.reduceat(histogram[int(edges[0]):int(edges[-1])], (edges[:-1] - edges[0]).astype(np.int64))
+    widths = np.diff(edges)
+    centers = np.sqrt(edges[:-1] * np.maximum(edges[1:] - 1, edges[:-1]))
+    density = totals / (widths * histogram.sum())
+    
+    mask = totals > 0
+    return centers[mask], density[mask]
+
+
+def fit_power_law(histogram, x_min=None, min_tail=10):
+    k = np.flatnonzero(histogram)
+    k = k[k > 0]
+    counts = histogram[k].astype(np.float64)
+    
+    tail_n = np.cumsum(counts[::-1])[::-1]
+    tail_log = np.cumsum((counts * np.log(k))[::-1])[::-1]
+    
+    if x_min is None:
+        candidates = np.flatnonzero(tail_n >= min_tail)
+        if len(candidates) == 0:
+            candidates = np.arange(min(len(k), 1))
+    else:
+        candidates = np.flatnonzero(k >= x_min)[:1]
+    
+    if len(candidates) == 0:
+        return {'alpha': np.nan, 'x_min': np.nan, 'ks_distance': np.nan, 'n_tail': 0}
+    
+    shift = np.log(k[candidates] - 0.5)
+    alphas = 1 + tail_n[candidates] / (tail_log[candidates] - tail_n[candidates] * shift)
+    
+    distances = np.empty(len(candidates))
+    for j, (i, alpha) in enumerate(zip(candidates, alphas)):
+        empirical = tail_n[i:] / tail_n[i]
+        model = ((k[i:] - 0.5) / (k[i] - 0.5)) ** (1 - alpha)
+        distances[j] = np.abs(empirical - model).max()
+    
+    best = int(np.argmin(distances))
+    i = candidates[best]
+    
+    return {
+        'alpha': float(alphas[best]),
+        'x_min': int(k[i]),
+        'ks_distance': float(distances[best]),
+        'n_tail': int(tail_n[i])
+    }
+
+
+def degree_statistics(G, num_bins=20, x_min=None):
+    degrees = degree_array(G)
+    histogram = np.bincount(degrees)
+    
+    k = np.flatnonzero(histogram)
+    ccdf = np.cumsum(histogram[::-1])[::-1][k] / len(degrees)
+    bin_centers, bin_density = log_binned_distribution(histogram, num_bins)
+    
+    return {
+        'degrees': degrees,
+        'histogram': histogram,
+        'log_bins': (bin_centers, bin_density),
+        'ccdf': (k, ccdf),
+        'power_law': fit_power_law(histogram, x_min)
+    }
+
+
 def analyze_degree_distribution(G):
-    degrees = [G.degree(n) for n in G.nodes()]
-    degree_counts = {}
-    
-    for d in degrees:
-        degree_counts[d] = degree_counts.get(d, 0) + 1
+    degree_stats = degree_statistics(G)
+    degrees = degree_stats['degrees']
+    histogram = degree_stats['histogram']
+    k = np.flatnonzero(histogram)
     
     stats = {
-        'min_degree': min(degrees),
-        'max_degree': max(degrees),
+        'min_degree': int(degrees.min()),
+        'max_degree': int(degrees.max()),
         'avg_degree': np.mean(degrees),
-        'degree_distribution': degree_counts
+        'degree_distribution': dict(zip(k.tolist(), histogram[k].tolist())),
+        'log_binned_distribution': degree_stats['log_bins'],
+        'ccdf': degree_stats['ccdf'],
+        'power_law_exponent': degree_stats['power_law']['alpha'],
+        'power_law_x_min': degree_stats['power_law']['x_min']
     }
     
     return stats
 
 
+def _plot_degree_counts(ax, G, style, title):
+    histogram = degree_statistics(G)['histogram']
+    k = np.flatnonzero(histogram)
+    
+    ax.loglog(k, histogram[k], style, markersize=8, linewidth=2)
+    ax.set_xlabel('Degree k', fontsize=12)
+    ax.set_ylabel('Count', fontsize=12)
+    ax.set_title(title, fontsize=14)
+    ax.grid(True, alpha=0.3)
+
+
 def plot_degree_distribution_comparison(G_BA, G_det, save_path='results/plots/degree_distribution.png'):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
-    degrees_BA = [G_BA.degree(n) for n in G_BA.nodes()]
-    degree_counts_BA = {}
-    for d in degrees_BA:
-        degree_counts_BA[d] = degree_counts_BA.get(d, 0) + 1
-    
-    degrees_sorted_BA = sorted(degree_counts_BA.keys())
-    counts_BA = [degree_counts_BA[d] for d in degrees_sorted_BA]
-    
-    ax1.loglog(degrees_sorted_BA, counts_BA, 'bo-', markersize=8, linewidth=2)
-    ax1.set_xlabel('Degree k', fontsize=12)
-    ax1.set_ylabel('Count', fontsize=12)
-    ax1.set_title('Barabási-Albert Model', fontsize=14)
-    ax1.grid(True, alpha=0.3)
-    
-    degrees_det = [G_det.degree(n) for n in G_det.nodes()]
-    degree_counts_det = {}
-    for d in degrees_det:
-        degree_counts_det[d] = degree_counts_det.get(d, 0) + 1
-    
-    degrees_sorted_det = sorted(degree_counts_det.keys())
-    counts_det = [degree_counts_det[d] for d in degrees_sorted_det]
-    
-    ax2.loglog(degrees_sorted_det, counts_det, 'ro-', markersize=8, linewidth=2)
-    ax2.set_xlabel('Degree k', fontsize=12)
-    ax2.set_ylabel('Count', fontsize=12)
-    ax2.set_title('Deterministic Scale-Free', fontsize=14)
-    ax2.grid(True, alpha=0.3)
+    _plot_degree_counts(ax1, G_BA, 'bo-', 'Barabási-Albert Model')
+    _plot_degree_counts(ax2, G_det, 'ro-', 'Deterministic Scale-Free')
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
 
-def visualize_networks(G_BA, G_det, save_path='results/plots/network_visualization.png'):
+def visualize_networks(G_BA, G_det, save_path='results/plots/network_visualization.png', seed=42):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
-    pos_BA = nx.spring_layout(G_BA, k=1, iterations=50)
+    pos_BA = cached_layout(G_BA, k=1, iterations=50, seed=seed)
     degrees_BA = [G_BA.degree(n) for n in G_BA.nodes()]
     node_sizes_BA = [50 + 20 * d for d in degrees_BA]
     
@@ -110,7 +256,7 @@ def visualize_networks(G_BA, G_det, save_path='results/plots/network_visualizati
     ax1.set_title('Barabási-Albert Model', fontsize=14)
     ax1.axis('off')
     
-    pos_det = nx.spring_layout(G_det, k=1, iterations=50)
+    pos_det = cached_layout(G_det, k=1, iterations=50, seed=seed)
     degrees_det = [G_det.degree(n) for n in G_det.nodes()]
     node_sizes_det = [50 + 20 * d for d in degrees_det]
     
@@ -121,103 +267,163 @@ def visualize_networks(G_BA, G_det, save_path='results/plots/network_visualizati
     ax2.axis('off')
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
 
+def node_ordering(G, method=None):
+    degrees = degree_array(G)
+    if method is None:
+        return np.arange(len(degrees))
+    if method == 'degree':
+        return np.argsort(-degrees, kind='stable')
+    if method == 'rcm':
+        return reverse_cuthill_mckee(_sparse_adjacency(G), symmetric_mode=True)
+    raise ValueError("method must be None, 'degree' or 'rcm'")
+
+
+def _sparse_adjacency(G):
+    if isinstance(G, CSRGraph):
+        return G.to_scipy()
+    return nx.to_scipy_sparse_array(G, weight=None, format='csr')
+
+
+def _adjacency_coordinates(G, order=None):
+    A = _sparse_adjacency(G).tocoo()
+    if order is None:
+        return A.row, A.col
+    
+    position = np.empty(len(order), dtype=np.int64)
+    position[order] = np.arange(len(order))
+    return position[A.row], position[A.col]
+
+
+def rasterize_adjacency(G, pixels=1000, order=None):
+    N = G.number_of_nodes()
+    if isinstance(order, str) or order is None:
+        order = node_ordering(G, order)
+    rows, cols = _adjacency_coordinates(G, order)
+    
+    cell = max(1, -(-N // pixels))
+    size = max(1, -(-N // cell))
+    counts = np.bincount((rows // cell) * size + cols // cell, minlength=size * size)
+    
+    spans = np.full(size, cell, dtype=np.float64)
+    spans[-1] = N - cell * (size - 1) if N else 1
+    
+    return counts.reshape(size, size) / np.outer(spans, spans)
+
+
+def _plot_adjacency(ax, G, cmap, title, order=None, label='Node Index'):
+    image = rasterize_adjacency(G, order=order)
+    N = G.number_of_nodes()
+    
+    im = ax.imshow(image, cmap=cmap, interpolation='nearest', extent=(-0.5, N - 0.5, N - 0.5, -0.5))
+    ax.set_title(title, fontsize=14)
+    ax.set_xlabel(label)
+    ax.set_ylabel(label)
+    plt.colorbar(im, ax=ax)
+
+
 def plot_adjacency_matrix(G_BA, G_det, save_path='results/plots/adjacency_matrix.png'):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
-    adj_BA = nx.adjacency_matrix(G_BA).todense()
-    im1 = ax1.imshow(adj_BA, cmap='Blues', interpolation='nearest')
-    ax1.set_title('BA Model - Adjacency Matrix', fontsize=14)
-    ax1.set_xlabel('Node Index')
-    ax1.set_ylabel('Node Index')
-    plt.colorbar(im1, ax=ax1)
-    
-    adj_det = nx.adjacency_matrix(G_det).todense()
-    im2 = ax2.imshow(adj_det, cmap='Reds', interpolation='nearest')
-    ax2.set_title('Deterministic - Adjacency Matrix', fontsize=14)
-    ax2.set_xlabel('Node Index')
-    ax2.set_ylabel('Node Index')
-    plt.colorbar(im2, ax=ax2)
+    _plot_adjacency(ax1, G_BA, 'Blues', 'BA Model - Adjacency Matrix')
+    _plot_adjacency(ax2, G_det, 'Reds', 'Deterministic - Adjacency Matrix')
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
 
-def plot_sorted_adjacency_matrix(G_BA, G_det, save_path='results/plots/sorted_adjacency_matrix.png'):
+def plot_sorted_adjacency_matrix(G_BA, G_det, save_path='results/plots/sorted_adjacency_matrix.png',
+                                 order='degree'):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
-    degrees_BA = dict(G_BA.degree())
-    nodes_BA_sorted = sorted(degrees_BA.keys(), key=lambda x: degrees_BA[x], reverse=True)
-    adj_BA = nx.adjacency_matrix(G_BA, nodelist=nodes_BA_sorted).todense()
-    
-    im1 = ax1.imshow(adj_BA, cmap='Blues', interpolation='nearest')
-    ax1.set_title('BA Model - Sorted by Degree', fontsize=14)
-    ax1.set_xlabel('Node Index (sorted)')
-    ax1.set_ylabel('Node Index (sorted)')
-    plt.colorbar(im1, ax=ax1)
-    
-    degrees_det = dict(G_det.degree())
-    nodes_det_sorted = sorted(degrees_det.keys(), key=lambda x: degrees_det[x], reverse=True)
-    adj_det = nx.adjacency_matrix(G_det, nodelist=nodes_det_sorted).todense()
-    
-    im2 = ax2.imshow(adj_det, cmap='Reds', interpolation='nearest')
-    ax2.set_title('Deterministic - Sorted by Degree', fontsize=14)
-    ax2.set_xlabel('Node Index (sorted)')
-    ax2.set_ylabel('Node Index (sorted)')
-    plt.colorbar(im2, ax=ax2)
+    name = 'Degree' if order == 'degree' else 'RCM'
+    _plot_adjacency(ax1, G_BA, 'Blues', f'BA Model - Sorted by {name}', order, 'Node Index (sorted)')
+    _plot_adjacency(ax2, G_det, 'Reds', f'Deterministic - Sorted by {name}', order, 'Node Index (sorted)')
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
 
-def calculate_blockiness(G):
-    adj = nx.adjacency_matrix(G).todense()
-    N = adj.shape[0]
-    
-    block_size = max(1, int(np.sqrt(N)))
+def block_counts(G, block_size=None, order=None):
+    N = G.number_of_nodes()
+    if block_size is None:
+        block_size = max(1, int(np.sqrt(N)))
     num_blocks = N // block_size
     
-    if num_blocks == 0:
-        return np.array([[0]])
+    if isinstance(order, str):
+        order = node_ordering(G, order)
+    rows, cols = _adjacency_coordinates(G, order)
     
-    block_density = np.zeros((num_blocks, num_blocks))
+    covered = (rows < num_blocks * block_size) & (cols < num_blocks * block_size)
+    cells = (rows[covered] // block_size) * num_blocks + cols[covered] // block_size
+    counts = np.bincount(cells, minlength=num_blocks * num_blocks).reshape(num_blocks, num_blocks)
     
-    for i in range(num_blocks):
-        for j in range(num_blocks):
-            block = adj[i*block_size:(i+1)*block_size, j*block_size:(j+1)*block_size]
-            block_density[i, j] = np.sum(block) / (block_size * block_size)
+    return counts, np.full((num_blocks, num_blocks), block_size * block_size, dtype=np.int64)
+
+
+def _pool_blocks(values):
+    n = values.shape[0]
+    if n % 2:
+        values = np.pad(values, ((0, 1), (0, 1)))
+    half = values.shape[0] // 2
+    return values.reshape(half, 2, half, 2).sum(axis=(1, 3))
+
+
+def blockiness_pyramid(G, order=None, block_size=None):
+    counts, areas = block_counts(G, block_size, order)
     
-    return block_density
+    levels = [(counts, areas)]
+    while counts.shape[0] > 1:
+        counts, areas = _pool_blocks(counts), _pool_blocks(areas)
+        levels.append((counts, areas))
+    
+    return [c / np.maximum(a, 1) for c, a in levels]
 
 
-def compare_blockiness(G_BA, G_det, save_path='results/plots/blockiness_comparison.png'):
+def calculate_blockiness(G, order=None):
+    if G.number_of_nodes() == 0:
+        return np.array([[0]])
+    
+    counts, areas = block_counts(G, order=order)
+    return counts / areas
+
+
+def compare_blockiness(G_BA, G_det, save_path='results/plots/blockiness_comparison.png',
+                       level=0, order=None, pyramids=None):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
-    block_BA = calculate_blockiness(G_BA)
+    if pyramids is None:
+        pyramids = (blockiness_pyramid(G_BA, order), blockiness_pyramid(G_det, order))
+    pyramid_BA, pyramid_det = pyramids
+    
+    block_BA = pyramid_BA[min(level, len(pyramid_BA) - 1)]
     im1 = ax1.imshow(block_BA, cmap='Blues', interpolation='nearest')
     ax1.set_title('BA Model - Block Density', fontsize=14)
     ax1.set_xlabel('Block Index')
     ax1.set_ylabel('Block Index')
     plt.colorbar(im1, ax=ax1)
     
-    block_det = calculate_blockiness(G_det)
+    block_det = pyramid_det[min(level, len(pyramid_det) - 1)]
     im2 = ax2.imshow(block_det, cmap='Reds', interpolation='nearest')
     ax2.set_title('Deterministic - Block Density', fontsize=14)
     ax2.set_xlabel('Block Index')
@@ -225,6 +431,8 @@ def compare_blockiness(G_BA, G_det, save_path='results/plots/blockiness_comparis
     plt.colorbar(im2, ax=ax2)
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
\ No newline at end of file
@@ -0,0 +1,2 @@
+from sn_common.graph import (CSRGraph, as_csr, as_networkx, distance_histogram, index_dtype, lattice_csr,
+                             popcount, row_offsets)
\ No newline at end of file
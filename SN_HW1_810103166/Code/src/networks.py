@@ -1,48 +1,99 @@
-import networkx as nx
 import numpy as np
 
+from .graph import CSRGraph, lattice_csr
 
-def create_1d_lattice(N, k=2):
-    G = nx.Graph()
-    G.add_nodes_from(range(N))
-    
-    for i in range(N):
-        for j in range(1, k//2 + 1):
-            G.add_edge(i, (i + j) % N)
-            G.add_edge(i, (i - j) % N)
-    
-    return G
+
+def as_backend(G, backend):
+    if backend == 'csr':
+        return G
+    if backend == 'networkx':
+        return G.to_networkx()
+    raise ValueError("backend must be 'networkx' or 'csr'")
+
+
+def create_1d_lattice(N, k=2, periodic=True, backend='networkx'):
+    G = lattice_csr((N,), reach=k // 2, periodic=periodic)
+    return as_backend(G, backend)
 
 
-def create_2d_lattice(N):
+def create_2d_lattice(N, periodic=True, backend='networkx'):
     side = int(np.sqrt(N))
     actual_N = side * side
     
-    G = nx.grid_2d_graph(side, side, periodic=True)
+    G = lattice_csr((side, side), periodic=periodic)
     
-    mapping = {node: i for i, node in enumerate(G.nodes())}
-    G = nx.relabel_nodes(G, mapping)
-    
-    return G, actual_N
+    return as_backend(G, backend), actual_N
 
 
-def create_3d_lattice(N):
+def create_3d_lattice(N, periodic=False, backend='networkx'):
     side = int(np.cbrt(N))
     actual_N = side ** 3
     
-    G = nx.grid_graph(dim=[side, side, side], periodic=False)
+    G = lattice_csr((side, side, side), periodic=periodic)
+    
+    return as_backend(G, backend), actual_N
+
+
+def sample_gnp_edges(N, p, seed=None):
+    rng = np.random.default_rng(seed)
+    total = N * (N - 1) // 2
+    p = min(p, 1.0)
+    
+    if p <= 0 or total == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    
+    expected = total * p
+    batch = int(min(expected + 4 * np.sqrt(expected) + 16, 1 << 24))
+    
+    chunks = []
+    position = -1
+    while position < total:
+        positions = position + np.cumsum(rng.geometric(p, size=batch))
+        chunks.append(positions[positions < total])
+        position = positions[-1]
+    
+    return decode_pair_indices(np.concatenate(chunks))
+
+
+def decode_pair_indices(L):
+    L = np.asarray(L, dtype=np.int64)
+    v = ((1 + np.sqrt(1 + 8 * L.astype(np.float64))) // 2).astype(np.int64)
+    v -= v * (v - 1) // 2 > L
+    v += (v + 1) * v // 2 <= L
+    w = L - v * (v - 1) // 2
+    
+    return np.column_stack([v, w])
+
+
+def _first_occurrences(keys):
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    first = order[np.diff(sorted_keys, prepend=-1) != 0]
+    return keys[np.sort(first)]
+
+
+def random_edge_sequence(N, num_edges, seed=None):
+    rng = np.random.default_rng(seed)
+    total = N * (N - 1) // 2
+    num_edges = min(num_edges, total)
+    block_size = max(1 << 12, N)
     
-    mapping = {node: i for i, node in enumerate(G.nodes())}
-    G = nx.relabel_nodes(G, mapping)
+    keys = np.zeros(0, dtype=np.int64)
+    seen = np.zeros(0, dtype=np.int64)
+    while len(keys) < num_edges:
+        block = _first_occurrences(rng.integers(total, size=block_size))
+        block = block[~np.isin(block, seen, assume_unique=True)]
+        keys = np.concatenate([keys, block])
+        seen = np.sort(keys)
     
-    return G, actual_N
+    return decode_pair_indices(keys[:num_edges])
 
 
-def create_random_network(N, avg_degree=8):
+def create_random_network(N, avg_degree=8, seed=None, backend='networkx'):
     min_degree = max(8, int(np.log(N)) + 2)
     actual_degree = max(avg_degree, min_degree)
     
     p = actual_degree / (N - 1)
-    G = nx.erdos_renyi_graph(N, p)
+    G = CSRGraph.from_edges(N, sample_gnp_edges(N, p, seed))
     
-    return G
\ No newline at end of file
+    return as_backend(G, backend)
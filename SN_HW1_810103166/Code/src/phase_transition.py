@@ -1,52 +1,230 @@
-import networkx as nx
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components, minimum_spanning_tree
+from scipy.stats import binom
 
+from .graph import CSRGraph
+from .networks import random_edge_sequence, sample_gnp_edges
+from .simulation_store import SIMULATION_STORE
 
-def simulate_erdos_renyi_evolution(N, k, num_realizations=50):
+
+GENERATOR_VERSION = 2
+
+
+def _cacheable(seed):
+    return isinstance(seed, (int, np.integer)) and not isinstance(seed, bool)
+
+
+QUANTITIES = ('giant_component_size', 'order_parameter', 'avg_small_cluster_size')
+
+
+def simulate_erdos_renyi_evolution(N, k, num_realizations=50, seed=None, store=None,
+                                   tolerance=None, min_realizations=5):
+    def simulate():
+        return _simulate_erdos_renyi(N, k, num_realizations, seed, tolerance, min_realizations)
+    
+    if not _cacheable(seed):
+        result = simulate()
+    else:
+        store = SIMULATION_STORE if store is None else store
+        key = store.key(kind='erdos_renyi', N=int(N), k=float(k), realizations=int(num_realizations),
+                        seed=int(seed), tolerance=tolerance, min_realizations=int(min_realizations),
+                        version=GENERATOR_VERSION)
+        result = store.get_or_compute(key, simulate)
+    
+    result = {name: float(value) for name, value in result.items()}
+    result['realizations'] = int(result['realizations'])
+    return result
+
+
+def _component_statistics(N, component_sizes):
+    if len(component_sizes) == 0:
+        return 0, 0, 0
+    
+    largest_size = component_sizes.max()
+    small_clusters = component_sizes[component_sizes != largest_size]
+    avg_small = np.mean(small_clusters) if len(small_clusters) > 0 else 0
+    
+    return largest_size, largest_size / N, avg_small
+
+
+def _simulate_erdos_renyi(N, k, num_realizations, seed, tolerance=None, min_realizations=5):
     p = k / (N - 1)
+    rng = np.random.default_rng(seed)
     
-    results = {
-        'giant_component_size': [],
-        'order_parameter': [],
-        'avg_small_cluster_size': []
-    }
+    count = 0
+    mean = np.zeros(len(QUANTITIES))
+    m2 = np.zeros(len(QUANTITIES))
     
-    for _ in range(num_realizations):
-        G = nx.erdos_renyi_graph(N, p)
+    while count < num_realizations:
+        G = CSRGraph.from_edges(N, sample_gnp_edges(N, p, rng))
         
-        components = list(nx.connected_components(G))
-        component_sizes = [len(c) for c in components]
+        _, labels = G.connected_components()
+        values = np.array(_component_statistics(N, np.bincount(labels)), dtype=float)
         
-        if len(component_sizes) > 0:
-            largest_size = max(component_sizes)
-            results['giant_component_size'].append(largest_size)
-            results['order_parameter'].append(largest_size / N)
-            
-            small_clusters = [s for s in component_sizes if s != largest_size]
-            if len(small_clusters) > 0:
-                avg_small = np.mean(small_clusters)
-            else:
-                avg_small = 0
-            results['avg_small_cluster_size'].append(avg_small)
-        else:
-            results['giant_component_size'].append(0)
-            results['order_parameter'].append(0)
-            results['avg_small_cluster_size'].append(0)
+        count += 1
+        delta = values - mean
+        mean += delta / count
+        m2 += delta * (values - mean)
+        
+        if tolerance is not None and count >= max(min_realizations, 2):
+            order_sem = np.sqrt(m2[1] / (count - 1) / count)
+            if order_sem < tolerance:
+                break
+    
+    sem = np.sqrt(m2 / (count - 1) / count) if count > 1 else np.full(len(QUANTITIES), np.nan)
+    
+    result = {name: mean[i] for i, name in enumerate(QUANTITIES)}
+    result.update({f'{name}_sem': sem[i] for i, name in enumerate(QUANTITIES)})
+    result['realizations'] = count
+    
+    return result
+
+
+def _merge_sizes(N, forest):
+    labels = forest
+    size = np.ones(N, dtype=np.int64)
+    position = np.arange(len(forest))
+    width = 1 << max(len(forest) - 1, 0).bit_length()
+    
+    while width > 1:
+        width //= 2
+        right = (position // width) % 2 == 1
+        left = labels[~right]
+        graph = coo_matrix((np.ones(len(left)), (left[:, 0], left[:, 1])), shape=(len(size), len(size)))
+        count, component = connected_components(graph, directed=False)
+        
+        labels = np.where(right[:, None], len(size) + component[labels], labels)
+        size = np.concatenate([size, np.bincount(component, size, count)])
+        
+        used = np.zeros(len(size), dtype=bool)
+        used[labels] = True
+        labels = (np.cumsum(used) - 1)[labels]
+        size = size[used]
+    
+    return size[labels]
+
+
+def _largest_counts(N, merged):
+    created = merged.sum(axis=1)
+    largest = np.maximum.accumulate(np.concatenate([[min(N, 1)], created]))
+    
+    span = len(merged) + 1
+    time = np.arange(1, span)
+    sizes = np.concatenate([[1], created, merged[:, 0], merged[:, 1]])
+    changes = np.concatenate([[N], np.ones_like(time), -np.ones_like(time), -np.ones_like(time)])
+    keys = sizes * span + np.concatenate([[0], time, time, time])
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    running = np.concatenate([[0], np.cumsum(changes[order])])
+    
+    last = np.searchsorted(keys, largest * span + np.arange(span), side='right')
+    first = np.searchsorted(keys, largest * span, side='left')
+    return largest, running[last] - running[first]
+
+
+def newman_ziff_sweep(N, num_edges, seed=None):
+    edges = random_edge_sequence(N, num_edges, seed)
+    
+    order = np.arange(1, len(edges) + 1, dtype=float)
+    forest = minimum_spanning_tree(coo_matrix((order, (edges[:, 0], edges[:, 1])), shape=(N, N)))
+    steps = np.sort(forest.data).astype(np.int64)
+    
+    largest, num_largest = _largest_counts(N, _merge_sizes(N, edges[steps - 1]))
+    clusters = N - np.arange(len(steps) + 1)
+    small = clusters - num_largest
+    avg_small = np.divide(N - largest * num_largest, small, out=np.zeros(len(small)), where=small > 0)
+    
+    done = np.searchsorted(steps, np.arange(len(edges) + 1), side='right')
+    return largest[done].astype(float), avg_small[done]
+
+
+def _edges_needed(N, k_max):
+    total = N * (N - 1) // 2
+    p = min(max(k_max / (N - 1), 0.0), 1.0)
+    mean = p * total
+    return int(min(total, np.ceil(mean + 10 * np.sqrt(mean * (1 - p)) + 10)))
+
+
+def _binomial_average(curve, N, k):
+    total = N * (N - 1) // 2
+    p = min(max(k / (N - 1), 0.0), 1.0)
+    if p == 0:
+        return curve[0]
+    
+    mean = p * total
+    spread = 10 * np.sqrt(mean * (1 - p)) + 1
+    m = np.arange(max(0, int(mean - spread)), min(len(curve) - 1, int(np.ceil(mean + spread))) + 1)
+    weights = binom.pmf(m, total, p)
+    
+    if weights.sum() == 0:
+        return curve[min(int(round(mean)), len(curve) - 1)]
+    return np.dot(weights, curve[m]) / weights.sum()
+
+
+def _sweep_ensemble(N, num_edges, num_realizations, seed):
+    if _cacheable(seed):
+        seeds = np.random.SeedSequence(int(seed), spawn_key=(int(N),)).spawn(num_realizations)
+    else:
+        rng = np.random.default_rng(seed)
+        seeds = [rng] * num_realizations
+    
+    ensemble = {name: np.zeros(num_edges + 1) for name in ('giant', 'avg_small', 'giant_sq', 'avg_small_sq')}
+    for realization_seed in seeds:
+        giant, avg_small = newman_ziff_sweep(N, num_edges, realization_seed)
+        for name, values in (('giant', giant), ('avg_small', avg_small),
+                             ('giant_sq', giant ** 2), ('avg_small_sq', avg_small ** 2)):
+            ensemble[name] = ensemble[name][:len(values)] + values
+    
+    return {name: values / num_realizations for name, values in ensemble.items()}
+
+
+def _percolation_ensemble(N, k_max, num_realizations, seed, store):
+    num_edges = _edges_needed(N, k_max)
+    
+    if not _cacheable(seed):
+        return _sweep_ensemble(N, num_edges, num_realizations, seed)
+    
+    store = SIMULATION_STORE if store is None else store
+    key = store.key(kind='newman_ziff', N=int(N), realizations=int(num_realizations),
+                    seed=int(seed), version=GENERATOR_VERSION)
+    ensemble = store.get(key)
+    max_edges = N * (N - 1) // 2
+    if ensemble is None or len(ensemble['giant']) < min(num_edges, max_edges) + 1:
+        ensemble = store.put(key, _sweep_ensemble(N, num_edges, num_realizations, seed))
+    
+    return ensemble
+
+
+def _evaluate_ensemble(ensemble, N, k_values, num_realizations):
+    averaged = {name: np.array([_binomial_average(curve, N, k) for k in k_values])
+                for name, curve in ensemble.items()}
+    
+    def standard_error(mean, mean_sq):
+        return np.sqrt(np.maximum(mean_sq - mean ** 2, 0) / num_realizations)
     
     return {
-        'giant_component_size': np.mean(results['giant_component_size']),
-        'order_parameter': np.mean(results['order_parameter']),
-        'avg_small_cluster_size': np.mean(results['avg_small_cluster_size'])
+        'k_values': np.asarray(k_values, dtype=float),
+        'giant_component_size': averaged['giant'],
+        'order_parameter': averaged['giant'] / N,
+        'order_parameter_err': standard_error(averaged['giant'], averaged['giant_sq']) / N,
+        'avg_small_cluster_size': averaged['avg_small'],
+        'avg_small_cluster_size_err': standard_error(averaged['avg_small'], averaged['avg_small_sq'])
     }
 
 
+def percolation_curves(N, k_values, num_realizations=50, seed=None, store=None):
+    k_values = np.asarray(k_values, dtype=float)
+    ensemble = _percolation_ensemble(N, k_values.max() if len(k_values) else 0,
+                                     num_realizations, seed, store)
+    return _evaluate_ensemble(ensemble, N, k_values, num_realizations)
+
+
 def phase_transition_analysis(N=1000, k_min=0, k_max=5, step_coarse=0.1, 
                               step_fine=0.02, critical_window=(0.8, 1.2), 
-                              num_realizations=50):
+                              num_realizations=50, seed=None, store=None):
     k_values = []
-    order_params = []
-    avg_cluster_sizes = []
     
     current_k = k_min
     while current_k <= k_max:
@@ -57,22 +235,57 @@ def phase_transition_analysis(N=1000, k_min=0, k_max=5, step_coarse=0.1,
         
         k_values.append(current_k)
         
-        results = simulate_erdos_renyi_evolution(N, current_k, num_realizations)
-        order_params.append(results['order_parameter'])
-        avg_cluster_sizes.append(results['avg_small_cluster_size'])
+        current_k = round(current_k + step, 10)
+    
+    results = percolation_curves(N, k_values, num_realizations, seed, store)
+    
+    return {
+        'k_values': results['k_values'],
+        'order_parameter': results['order_parameter'],
+        'order_parameter_err': results['order_parameter_err'],
+        'avg_cluster_size': results['avg_small_cluster_size'],
+        'avg_cluster_size_err': results['avg_small_cluster_size_err']
+    }
+
+
+def adaptive_phase_transition_analysis(N=1000, k_min=0, k_max=5, initial_points=11, resolution=1e-3,
+                                       tolerance=0.02, max_points=120, num_realizations=50,
+                                       seed=None, store=None):
+    ensemble = _percolation_ensemble(N, k_max, num_realizations, seed, store)
+    curves = _evaluate_ensemble(ensemble, N, np.linspace(k_min, k_max, initial_points), num_realizations)
+    
+    while len(curves['k_values']) < max_points:
+        k_values = curves['k_values']
+        score = np.zeros(len(k_values) - 1)
+        for name in ('order_parameter', 'avg_small_cluster_size'):
+            values = curves[name]
+            score = np.maximum(score, np.abs(np.diff(values)) / max(np.ptp(values), 1e-12))
+        peak = np.argmax(curves['avg_small_cluster_size'])
+        score[max(peak - 1, 0):peak + 1] = np.inf
+        score[np.diff(k_values) <= resolution] = 0
+        
+        candidates = np.flatnonzero(score > tolerance)
+        if len(candidates) == 0:
+            break
+        candidates = candidates[np.argsort(-score[candidates])][:max_points - len(k_values)]
         
-        current_k += step
+        midpoints = (k_values[candidates] + k_values[candidates + 1]) / 2
+        refined = _evaluate_ensemble(ensemble, N, midpoints, num_realizations)
+        order = np.argsort(np.concatenate([k_values, midpoints]), kind='stable')
+        curves = {name: np.concatenate([curves[name], refined[name]])[order] for name in curves}
     
     return {
-        'k_values': np.array(k_values),
-        'order_parameter': np.array(order_params),
-        'avg_cluster_size': np.array(avg_cluster_sizes)
+        'k_values': curves['k_values'],
+        'order_parameter': curves['order_parameter'],
+        'order_parameter_err': curves['order_parameter_err'],
+        'avg_cluster_size': curves['avg_small_cluster_size'],
+        'avg_cluster_size_err': curves['avg_small_cluster_size_err'],
+        'critical_point': curves['k_values'][np.argmax(curves['avg_small_cluster_size'])]
     }
 
 
 def plot_phase_transition(results, save_path='results/plots/phase_transition.png'):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
@@ -81,6 +294,9 @@ def plot_phase_transition(results, save_path='results/plots/phase_transition.png
     avg_cluster = results['avg_cluster_size']
     
     ax1.plot(k_values, order_param, 'b-', linewidth=2)
+    if 'order_parameter_err' in results:
+        err = results['order_parameter_err']
+        ax1.fill_between(k_values, order_param - err, order_param + err, color='b', alpha=0.2)
     ax1.axvline(x=1.0, color='r', linestyle='--', label='Theoretical critical point <k>=1')
     ax1.set_xlabel('Average Degree <k>', fontsize=12)
     ax1.set_ylabel('Order Parameter S = N_G/N', fontsize=12)
@@ -89,6 +305,9 @@ def plot_phase_transition(results, save_path='results/plots/phase_transition.png
     ax1.legend()
     
     ax2.plot(k_values, avg_cluster, 'g-', linewidth=2)
+    if 'avg_cluster_size_err' in results:
+        err = results['avg_cluster_size_err']
+        ax2.fill_between(k_values, avg_cluster - err, avg_cluster + err, color='g', alpha=0.2)
     ax2.axvline(x=1.0, color='r', linestyle='--', label='Theoretical critical point <k>=1')
     ax2.set_xlabel('Average Degree <k>', fontsize=12)
     ax2.set_ylabel('Average Size of Small Clusters <s>', fontsize=12)
@@ -97,29 +316,25 @@ def plot_phase_transition(results, save_path='results/plots/phase_transition.png
     ax2.legend()
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
 
-def finite_size_analysis(k_values, N_values, num_realizations=50):
+def finite_size_analysis(k_values, N_values, num_realizations=50, seed=None, store=None):
     results = {}
     
     for N in N_values:
-        order_params = []
-        
-        for k in k_values:
-            result = simulate_erdos_renyi_evolution(N, k, num_realizations)
-            order_params.append(result['order_parameter'])
-        
-        results[N] = np.array(order_params)
+        curves = percolation_curves(N, k_values, num_realizations, seed, store)
+        results[N] = curves['order_parameter']
     
     return results
 
 
 def plot_finite_size_effects(k_values, finite_size_results, save_path='results/plots/finite_size_effects.png'):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -138,7 +353,9 @@ def plot_finite_size_effects(k_values, finite_size_results, save_path='results/p
     ax.legend(fontsize=11)
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
@@ -159,24 +376,19 @@ def analyze_transition_sharpness(k_values, finite_size_results):
     return sharpness
 
 
-def analyze_divergence_at_criticality(N_values, k_critical=1.0, k_range=0.3, num_points=20, num_realizations=50):
+def analyze_divergence_at_criticality(N_values, k_critical=1.0, k_range=0.3, num_points=20, num_realizations=50,
+                                      seed=None, store=None):
     results = {}
     
     k_values = np.linspace(k_critical - k_range, k_critical + k_range, num_points)
     
     for N in N_values:
-        order_params = []
-        avg_clusters = []
-        
-        for k in k_values:
-            result = simulate_erdos_renyi_evolution(N, k, num_realizations)
-            order_params.append(result['order_parameter'])
-            avg_clusters.append(result['avg_small_cluster_size'])
+        curves = percolation_curves(N, k_values, num_realizations, seed, store)
         
         results[N] = {
             'k_values': k_values,
-            'order_parameter': np.array(order_params),
-            'avg_cluster_size': np.array(avg_clusters)
+            'order_parameter': curves['order_parameter'],
+            'avg_cluster_size': curves['avg_small_cluster_size']
         }
     
     return results
@@ -184,7 +396,6 @@ def analyze_divergence_at_criticality(N_values, k_critical=1.0, k_range=0.3, num
 
 def plot_divergence_analysis(divergence_results, save_path='results/plots/divergence_analysis.png'):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
@@ -219,29 +430,27 @@ def plot_divergence_analysis(divergence_results, save_path='results/plots/diverg
     ax2.set_xscale('log')
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
 
-def calculate_giant_component_scaling(N_values, k_values_near_critical, num_realizations=50):
-    scaling_results = {}
+def calculate_giant_component_scaling(N_values, k_values_near_critical, num_realizations=50, seed=None,
+                                      store=None):
+    curves = [percolation_curves(N, k_values_near_critical, num_realizations, seed, store)['order_parameter']
+              for N in N_values]
     
-    for k in k_values_near_critical:
-        giant_sizes = []
-        
-        for N in N_values:
-            result = simulate_erdos_renyi_evolution(N, k, num_realizations)
-            giant_sizes.append(result['order_parameter'])
-        
-        scaling_results[k] = np.array(giant_sizes)
+    scaling_results = {}
+    for i, k in enumerate(k_values_near_critical):
+        scaling_results[k] = np.array([curve[i] for curve in curves])
     
     return scaling_results
 
 
 def plot_giant_component_scaling(N_values, scaling_results, save_path='results/plots/giant_component_scaling.png'):
     import os
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
     
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -256,6 +465,8 @@ def plot_giant_component_scaling(N_values, scaling_results, save_path='results/p
     ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
\ No newline at end of file
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+
+class SimulationStore:
+    def __init__(self, cache_dir=None, max_entries=64):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+    
+    @staticmethod
+    def key(**params):
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.npz')
+    
+    def get(self, key):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+        
+        if self.cache_dir is not None and os.path.exists(self._path(key)):
+            with np.load(self._path(key)) as data:
+                arrays = {name: data[name] for name in data.files}
+            self._remember(key, arrays)
+            self.hits += 1
+            return arrays
+        
+        self.misses += 1
+        return None
+    
+    def put(self, key, arrays):
+        arrays = {name: np.asarray(value) for name, value in arrays.items()}
+        self._remember(key, arrays)
+        
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._path(key) + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self._path(key))
+        
+        return arrays
+    
+    def get_or_compute(self, key, compute):
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = self.put(key, compute())
+        return arrays
+    
+    def clear(self, disk=False):
+        self._memory.clear()
+        if disk and self.cache_dir is not None and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.npz'):
+                    os.remove(os.path.join(self.cache_dir, name))
+    
+    def _remember(self, key, arrays):
+        self._memory[key] = arrays
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+SIMULATION_STORE = SimulationStore(cache_dir=os.environ.get('SN_SIMULATION_CACHE'))
\ No newline at end of file
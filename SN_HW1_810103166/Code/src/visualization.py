@@ -27,7 +27,7 @@ def plot_scaling_results(results, save_path='results/plots/scaling_behavior.png'
     
     for network_type, data in results.items():
         if len(data['N']) > 0:
-            N_arr = np.array(data['N'])
+            N_arr = np.array(data.get('actual_N', data['N']))
             d_arr = np.array(data['d'])
             
             ax1.scatter(N_arr, d_arr, label=network_type, 
@@ -74,7 +74,7 @@ def plot_scaling_results(results, save_path='results/plots/scaling_behavior.png'
     
     for network_type, data in results.items():
         if len(data['N']) > 0:
-            N_arr = np.array(data['N'])
+            N_arr = np.array(data.get('actual_N', data['N']))
             d_arr = np.array(data['d'])
             ax2.scatter(N_arr, d_arr, label=network_type, 
                        color=colors[network_type], s=50, alpha=0.7)
@@ -88,7 +88,8 @@ def plot_scaling_results(results, save_path='results/plots/scaling_behavior.png'
     ax2.grid(True, alpha=0.3, which='both')
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"Plot saved to {save_path}")
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Plot saved to {save_path}")
     
     return fig
\ No newline at end of file
@@ -0,0 +1,11 @@
+import pytest
+
+from src import phase_transition
+from src.simulation_store import SimulationStore
+
+
+@pytest.fixture(autouse=True)
+def simulation_store(tmp_path, monkeypatch):
+    store = SimulationStore(cache_dir=str(tmp_path / 'simulations'))
+    monkeypatch.setattr(phase_transition, 'SIMULATION_STORE', store)
+    return store
\ No newline at end of file
@@ -1,8 +1,14 @@
 import pytest
 import networkx as nx
 import numpy as np
-from src.networks import create_1d_lattice
-from src.analysis import calculate_average_shortest_path
+from src.networks import create_1d_lattice, create_random_network
+from src.analysis import (
+    calculate_average_shortest_path,
+    estimate_average_shortest_path,
+    exact_average_shortest_path,
+    load_simulation_store,
+    run_simulation
+)
 
 
 def test_shortest_path_small_network():
@@ -26,4 +32,112 @@ def test_shortest_path_sampling():
     G = create_1d_lattice(2000, k=2)
     d = calculate_average_shortest_path(G, sample_size=100)
     assert isinstance(d, float)
-    assert d > 0
\ No newline at end of file
+    assert d > 0
+
+
+def test_estimate_is_exact_when_all_sources_used():
+    G = nx.karate_club_graph()
+    result = estimate_average_shortest_path(G, rel_error=0)
+    assert result['exact']
+    assert result['num_sources'] == G.number_of_nodes()
+    assert np.isclose(result['estimate'], nx.average_shortest_path_length(G))
+
+
+def test_estimate_stops_early():
+    G = create_random_network(5000, seed=0, backend='csr')
+    result = estimate_average_shortest_path(G, rel_error=0.01, seed=0)
+    assert result['num_sources'] < G.number_of_nodes()
+    low, high = result['ci']
+    assert low <= result['estimate'] <= high
+    assert (high - low) / 2 <= 0.01 * result['estimate']
+
+
+def test_estimate_checks_stop_before_memory_batch_fills():
+    G = create_random_network(2000, seed=0, backend='csr')
+    result = estimate_average_shortest_path(G, rel_error=0.05, min_sources=10, seed=0)
+    assert result['num_sources'] < 100
+
+
+def test_estimate_uses_largest_component():
+    G = nx.path_graph(5)
+    G.add_edge(10, 11)
+    result = estimate_average_shortest_path(G, rel_error=0)
+    assert np.isclose(result['estimate'], nx.average_shortest_path_length(nx.path_graph(5)))
+
+
+def test_exact_matches_networkx():
+    G = nx.grid_2d_graph(9, 11)
+    result = exact_average_shortest_path(G)
+    assert np.isclose(result['average'], nx.average_shortest_path_length(G))
+    assert result['num_pairs'] == 99 * 98
+    assert result['diameter'] == 18
+
+
+def test_exact_distance_distribution_across_chunks():
+    G = nx.barbell_graph(50, 40)
+    result = exact_average_shortest_path(G, max_bytes=1)
+    expected = np.zeros(result['diameter'] + 1, dtype=np.int64)
+    for _, lengths in nx.all_pairs_shortest_path_length(G):
+        for d in lengths.values():
+            expected[d] += d > 0
+    assert np.array_equal(result['distance_distribution'], expected)
+
+
+def test_calculate_average_shortest_path_exact_mode():
+    G = create_1d_lattice(300, k=2)
+    assert np.isclose(calculate_average_shortest_path(G, exact=True),
+                      nx.average_shortest_path_length(G))
+
+
+def test_run_simulation_structure():
+    results = run_simulation([64, 125], workers=1, seed=0)
+    assert set(results) == {'1D Lattice', '2D Lattice', '3D Lattice', 'Random Network'}
+    assert results['1D Lattice']['N'] == [64, 125]
+    assert results['3D Lattice']['N'] == [64, 125]
+
+
+def test_run_simulation_keeps_requested_sizes_apart():
+    results = run_simulation([100, 110], network_types=['2D Lattice'], workers=1, seed=0, verbose=False)
+    
+    assert results['2D Lattice']['N'] == [100, 110]
+    assert results['2D Lattice']['actual_N'] == [100, 100]
+    assert len(results['2D Lattice']['d']) == 2
+
+
+def test_run_simulation_resume_skips_completed(tmp_path):
+    store_path = str(tmp_path / 'simulation.jsonl')
+    first = run_simulation([100], replicates=2, network_types=['Random Network'],
+                           workers=1, store_path=store_path, seed=5)
+    assert len(load_simulation_store(store_path)) == 2
+    
+    resumed = run_simulation([100, 200], replicates=2, network_types=['Random Network'],
+                             workers=1, store_path=store_path, resume=True, seed=5)
+    assert len(load_simulation_store(store_path)) == 4
+    assert resumed['Random Network']['d'][:len(first['Random Network']['d'])] == \
+        first['Random Network']['d']
+    
+    subset = run_simulation([200], replicates=1, network_types=['Random Network'],
+                            workers=1, store_path=store_path, resume=True, seed=5)
+    assert subset['Random Network']['N'] == [200]
+    assert len(load_simulation_store(store_path)) == 4
+
+
+def test_run_simulation_refuses_mismatched_resume(tmp_path):
+    store_path = str(tmp_path / 'simulation.jsonl')
+    run_simulation([100], network_types=['Random Network'], workers=1, store_path=store_path,
+                   seed=5, verbose=False)
+    
+    with pytest.raises(ValueError):
+        run_simulation([100], network_types=['Random Network'], workers=1, store_path=store_path,
+                       resume=True, seed=6, verbose=False)
+    with pytest.raises(ValueError):
+        run_simulation([100], network_types=['Random Network'], workers=1, store_path=store_path,
+                       resume=True, seed=5, sample_size=10, verbose=False)
+
+
+def test_run_simulation_is_reproducible_across_workers():
+    serial = run_simulation([200], replicates=2, network_types=['Random Network'],
+                            workers=1, seed=9)
+    parallel = run_simulation([200], replicates=2, network_types=['Random Network'],
+                              workers=2, seed=9)
+    assert serial == parallel
\ No newline at end of file
@@ -0,0 +1,64 @@
+import pytest
+import os
+import matplotlib
+import numpy as np
+import pandas as pd
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from src.export import export_figures, spec_hash
+from src.visualization import plot_scaling_results
+
+
+RESULTS = {'Random Network': {'N': [100, 200, 400], 'd': [2.1, 2.4, 2.7]}}
+
+
+def test_export_figures_writes_all_formats(tmp_path):
+    specs = [{'name': 'scaling', 'plot': plot_scaling_results, 'args': (RESULTS,)}]
+    results = export_figures(specs, output_dir=str(tmp_path), formats=('png', 'svg', 'pdf'), workers=1, dpi=50)
+    
+    assert not results['scaling']['skipped']
+    assert all(os.path.exists(path) for path in results['scaling']['paths'])
+    assert plt.get_fignums() == []
+
+
+def test_export_figures_applies_dpi_to_every_format(tmp_path):
+    specs = [{'name': 'scaling', 'plot': plot_scaling_results, 'args': (RESULTS,)}]
+    low = plt.imread(export_figures(specs, output_dir=str(tmp_path / 'low'), workers=1, dpi=50)['scaling']['paths'][0])
+    high = plt.imread(export_figures(specs, output_dir=str(tmp_path / 'high'), workers=1, dpi=100)['scaling']['paths'][0])
+    
+    assert abs(high.shape[1] - 2 * low.shape[1]) <= 4
+
+
+def test_export_figures_skips_unchanged_data(tmp_path):
+    specs = [{'name': 'scaling', 'plot': plot_scaling_results, 'args': (RESULTS,)}]
+    export_figures(specs, output_dir=str(tmp_path), workers=1, dpi=50)
+    
+    assert export_figures(specs, output_dir=str(tmp_path), workers=1, dpi=50)['scaling']['skipped']
+    
+    changed = [{'name': 'scaling', 'plot': plot_scaling_results,
+                'args': ({'Random Network': {'N': [100, 200], 'd': [2.1, 2.4]}},)}]
+    assert not export_figures(changed, output_dir=str(tmp_path), workers=1, dpi=50)['scaling']['skipped']
+
+
+def test_spec_hash_is_canonical():
+    def spec(frame, options):
+        return {'name': 'scaling', 'plot': plot_scaling_results, 'args': (frame,), 'kwargs': options}
+    
+    frame = pd.DataFrame({'N': [100, 200], 'd': np.array([2.1, 2.4])})
+    same = spec_hash(spec(frame, {'a': 1, 'b': [1, 2]}), ('png',), 50)
+    
+    assert same == spec_hash(spec(frame.copy(), {'b': [1, 2], 'a': 1}), ('png',), 50)
+    assert same != spec_hash(spec(frame.assign(d=[2.1, 2.5]), {'a': 1, 'b': [1, 2]}), ('png',), 50)
+
+
+def test_plots_skip_saving_without_a_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fig = plot_scaling_results(RESULTS, save_path=None)
+    plt.close(fig)
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_export_figures_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        export_figures([], output_dir=str(tmp_path), formats=('bmp',))
\ No newline at end of file
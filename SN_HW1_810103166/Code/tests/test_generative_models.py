@@ -1,7 +1,17 @@
 import pytest
 import networkx as nx
+import numpy as np
+from scipy.stats import ks_2samp
+from src.graph import CSRGraph
 from src.generative_models import (
+    barabasi_albert_edges,
     barabasi_albert_model,
+    generate_ensemble,
+    degree_statistics,
+    node_ordering,
+    rasterize_adjacency,
+    calculate_blockiness,
+    blockiness_pyramid,
     deterministic_scale_free_construction,
     analyze_degree_distribution
 )
@@ -43,4 +53,155 @@ def test_analyze_degree_distribution():
     assert 'max_degree' in stats
     assert 'avg_degree' in stats
     assert stats['min_degree'] > 0
-    assert stats['max_degree'] >= stats['min_degree']
\ No newline at end of file
+    assert stats['max_degree'] >= stats['min_degree']
+
+def _sorted_scale_free_construction(iterations):
+    G = nx.Graph()
+    G.add_edges_from([(0, 1), (1, 2), (2, 0)])
+    next_node = 3
+    
+    for iteration in range(iterations):
+        edge_scores = sorted(((G.degree(u) + G.degree(v), (u, v)) for u, v in G.edges()), reverse=True)
+        u, v = edge_scores[0][1]
+        G.remove_edge(u, v)
+        G.add_edge(next_node, u)
+        G.add_edge(next_node, v)
+        next_node += 1
+    
+    return G
+
+
+def test_deterministic_scale_free_matches_sorted_selection():
+    for iterations in [0, 1, 5, 200]:
+        G = deterministic_scale_free_construction(iterations)
+        reference = _sorted_scale_free_construction(iterations)
+        
+        assert list(G.nodes()) == list(reference.nodes())
+        assert list(G.edges()) == list(reference.edges())
+        assert {n: list(G[n]) for n in G} == {n: list(reference[n]) for n in reference}
+
+def test_barabasi_albert_edges_shape():
+    N, m = 200, 3
+    edges = barabasi_albert_edges(N, m, seed=0)
+    
+    assert edges.shape == (m * (N - m), 2)
+    assert (edges[m:, 1] < edges[m:, 0]).all()
+    rows = edges[m:].reshape(-1, m, 2)
+    assert all(len(set(row[:, 1])) == m for row in rows)
+
+
+def test_barabasi_albert_csr_backend_is_reproducible():
+    G = barabasi_albert_model(500, 2, seed=3, backend='csr')
+    H = barabasi_albert_model(500, 2, seed=3, backend='csr')
+    
+    assert isinstance(G, CSRGraph)
+    assert G.number_of_edges() == 2 * (500 - 2)
+    assert G.is_connected()
+    assert np.array_equal(G.indices, H.indices)
+
+
+def test_barabasi_albert_matches_networkx_degree_distribution():
+    N, m = 5000, 3
+    degrees = barabasi_albert_model(N, m, seed=1, backend='csr').degree()
+    reference = np.array([d for _, d in nx.barabasi_albert_graph(N, m, seed=1).degree()])
+    
+    assert degrees.min() == m
+    assert ks_2samp(degrees, reference).pvalue > 0.01
+
+
+def test_barabasi_albert_duplicate_redraws_are_unbiased():
+    N, m, runs = 20, 3, 3000
+    ours = np.array([np.bincount(barabasi_albert_edges(N, m, seed=s).ravel(), minlength=N) for s in range(runs)])
+    reference = np.array([[d for _, d in sorted(nx.barabasi_albert_graph(N, m, seed=s).degree())]
+                          for s in range(runs)])
+    
+    error = np.sqrt((ours.var(axis=0) + reference.var(axis=0)) / runs)[:-1]
+    z = (ours.mean(axis=0) - reference.mean(axis=0))[:-1] / error
+    assert np.abs(z).max() < 4
+
+
+def test_generate_ensemble():
+    ensemble = generate_ensemble(300, 2, 3, seed=0, workers=1)
+    
+    assert len(ensemble) == 3
+    assert all(G.number_of_edges() == 2 * 298 for G in ensemble)
+    assert not np.array_equal(ensemble[0].indices, ensemble[1].indices)
+
+
+def test_analyze_degree_distribution_csr():
+    G = barabasi_albert_model(300, 2, seed=0, backend='csr')
+    stats = analyze_degree_distribution(G)
+    
+    assert stats['min_degree'] == 2
+    assert sum(stats['degree_distribution'].values()) == 300
+
+
+def test_degree_statistics_histogram_and_ccdf():
+    G = nx.star_graph(4)
+    stats = degree_statistics(G)
+    
+    assert stats['histogram'].tolist() == [0, 4, 0, 0, 1]
+    k, ccdf = stats['ccdf']
+    assert k.tolist() == [1, 4]
+    assert np.allclose(ccdf, [1.0, 0.2])
+
+
+def test_degree_statistics_power_law_exponent():
+    G = barabasi_albert_model(200000, 3, seed=0, backend='csr')
+    fit = degree_statistics(G)['power_law']
+    
+    assert 2.6 < fit['alpha'] < 3.4
+    assert fit['x_min'] >= 3
+    
+    centers, density = degree_statistics(G)['log_bins']
+    assert np.all(np.diff(centers) > 0)
+    assert np.all(np.diff(density) < 0)
+
+
+def test_rasterize_adjacency_matches_dense_matrix():
+    G = barabasi_albert_model(40, 2, seed=0)
+    
+    assert np.array_equal(rasterize_adjacency(G), nx.adjacency_matrix(G).todense())
+    
+    degrees = dict(G.degree())
+    nodes_sorted = sorted(degrees, key=lambda x: degrees[x], reverse=True)
+    assert np.array_equal(rasterize_adjacency(G, order='degree'),
+                          nx.adjacency_matrix(G, nodelist=nodes_sorted).todense())
+
+
+def test_rasterize_adjacency_bins_large_graphs():
+    G = barabasi_albert_model(5000, 3, seed=0, backend='csr')
+    image = rasterize_adjacency(G, pixels=100, order='rcm')
+    
+    assert image.shape == (100, 100)
+    assert np.isclose(image.sum() * 50 * 50, 2 * G.number_of_edges())
+    assert sorted(node_ordering(G, 'rcm')) == list(range(5000))
+
+
+def _dense_blockiness(G):
+    adj = nx.adjacency_matrix(G).todense()
+    N = adj.shape[0]
+    block_size = max(1, int(np.sqrt(N)))
+    num_blocks = N // block_size
+    
+    block_density = np.zeros((num_blocks, num_blocks))
+    for i in range(num_blocks):
+        for j in range(num_blocks):
+            block = adj[i*block_size:(i+1)*block_size, j*block_size:(j+1)*block_size]
+            block_density[i, j] = np.sum(block) / (block_size * block_size)
+    
+    return block_density
+
+
+def test_calculate_blockiness_matches_dense_blocks():
+    for G in [barabasi_albert_model(103, 2, seed=0), deterministic_scale_free_construction(60)]:
+        assert np.allclose(calculate_blockiness(G), _dense_blockiness(G))
+
+
+def test_blockiness_pyramid_pools_counts():
+    G = barabasi_albert_model(400, 3, seed=0)
+    pyramid = blockiness_pyramid(G, order='degree')
+    
+    assert [level.shape[0] for level in pyramid] == [20, 10, 5, 3, 2, 1]
+    assert np.allclose(pyramid[1], pyramid[0].reshape(10, 2, 10, 2).mean(axis=(1, 3)))
+    assert np.isclose(pyramid[-1][0, 0], 2 * G.number_of_edges() / 400 ** 2)
\ No newline at end of file
@@ -0,0 +1,95 @@
+import pytest
+import networkx as nx
+import numpy as np
+from src.graph import CSRGraph, distance_histogram, lattice_csr, popcount
+
+
+def test_from_edges_deduplicates():
+    G = CSRGraph.from_edges(4, [(0, 1), (1, 0), (1, 2), (2, 2)])
+    assert G.number_of_nodes() == 4
+    assert G.number_of_edges() == 2
+    assert list(G.degree()) == [1, 2, 1, 0]
+
+
+def test_index_arrays_are_int32():
+    G = lattice_csr((10, 10))
+    assert G.indptr.dtype == np.int32
+    assert G.indices.dtype == np.int32
+
+
+def test_small_periodic_lattice_has_no_duplicates():
+    G = lattice_csr((2, 2), periodic=True)
+    assert all(G.degree() == 2)
+
+
+def test_round_trip_networkx():
+    G = nx.karate_club_graph()
+    csr = CSRGraph.from_networkx(G)
+    H = csr.to_networkx()
+    assert H.number_of_edges() == G.number_of_edges()
+    assert nx.is_isomorphic(G, H)
+
+
+def test_connected_components():
+    G = CSRGraph.from_edges(5, [(0, 1), (2, 3)])
+    n_components, labels = G.connected_components()
+    assert n_components == 3
+    assert not G.is_connected()
+    assert labels[0] == labels[1]
+
+
+def test_popcount():
+    words = np.array([0, 1, 3, np.iinfo(np.uint64).max], dtype=np.uint64)
+    assert popcount(words) == 67
+
+def test_csr_graph_keeps_labels_and_attributes():
+    G = nx.DiGraph()
+    G.add_edge('a', 'b', weight=2.0)
+    G.add_edge('b', 'c', weight=3.0)
+    G.add_edge('c', 'a', weight=1.5)
+    
+    C = CSRGraph.from_networkx(G, weight='weight')
+    
+    assert C.directed and C.nodes == ['a', 'b', 'c']
+    assert C.index('c') == 2
+    assert C.to_scipy()[0, 1] == 2.0
+    assert C.transpose().to_scipy()[1, 0] == 2.0
+    assert C.transpose() is C.transpose()
+    assert C.to_undirected().number_of_edges() == 3
+    assert nx.utils.edges_equal(C.to_networkx().edges(data=True), G.edges(data=True))
+
+
+def test_csr_graph_signs_follow_symmetrization():
+    C = CSRGraph.from_edges(3, [(0, 1), (1, 2)], signs=[-1, 1])
+    
+    assert C.signs.tolist() == [-1, -1, 1, 1]
+    assert C.to_networkx()[2][1]['sign'] == 1
+
+
+def test_directed_views_keep_edge_and_node_attributes():
+    G = nx.DiGraph()
+    G.add_node('a', smokes=1)
+    G.add_node('b', smokes=0)
+    G.add_edge('a', 'b', weight=2.0, sign=-1)
+    G.add_edge('b', 'c', weight=3.0, sign=1)
+    
+    C = CSRGraph.from_networkx(G, weight='weight', sign='sign')
+    T = C.transpose()
+    
+    assert T.to_scipy()[1, 0] == 2.0 and T.to_scipy()[2, 1] == 3.0
+    assert T.signs[T.indptr[1]] == -1
+    assert C.to_undirected().to_scipy()[2, 1] == 3.0
+    assert C.to_undirected().signs.tolist() == [-1, -1, 1, 1]
+    assert C.node_attributes('a') == {'smokes': 1}
+    assert C.node_data['smokes'].dtype == np.float64
+    assert C.to_undirected().node_attributes('c') == {}
+    assert dict(C.to_networkx().nodes(data=True)) == dict(G.nodes(data=True))
+
+
+@pytest.mark.parametrize('G', [nx.cycle_graph(301), nx.path_graph(150), nx.barabasi_albert_graph(120, 2, seed=1)])
+def test_distance_histogram_matches_networkx(G):
+    expected = np.bincount([d for _, row in nx.all_pairs_shortest_path_length(G) for d in row.values()])
+    expected[0] = 0
+    
+    assert distance_histogram(CSRGraph.from_networkx(G)).tolist() == expected.tolist()
+    assert distance_histogram(CSRGraph.from_networkx(G), max_bytes=1).tolist() == expected.tolist()
@@ -0,0 +1,79 @@
+import pytest
+import networkx as nx
+import numpy as np
+from src.layout import cached_layout, force_directed_layout
+from src.generative_models import barabasi_albert_model
+from src.graph import as_csr
+from sn_common.cache import ArrayCache
+from sn_common.graph import graph_fingerprint
+from sn_common.layout import _barnes_hut_repulsion, _exact_repulsion
+
+
+def test_layout_covers_all_nodes_and_is_scaled():
+    G = nx.karate_club_graph()
+    pos = force_directed_layout(G, seed=0)
+    
+    assert set(pos) == set(G.nodes())
+    coords = np.array(list(pos.values()))
+    assert np.isclose(np.abs(coords).max(), 1.0)
+
+
+def test_layout_is_reproducible():
+    G = barabasi_albert_model(800, 2, seed=0, backend='csr')
+    first = force_directed_layout(G, iterations=10, seed=3)
+    second = force_directed_layout(G, iterations=10, seed=3)
+    
+    assert all(np.array_equal(first[n], second[n]) for n in first)
+
+
+def test_layout_keeps_neighbors_closer_than_random_pairs():
+    G = nx.grid_2d_graph(30, 30)
+    pos = force_directed_layout(G, seed=0)
+    coords = np.array([pos[n] for n in G.nodes()])
+    index = {n: i for i, n in enumerate(G.nodes())}
+    
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()])
+    edge_length = np.linalg.norm(coords[edges[:, 0]] - coords[edges[:, 1]], axis=1).mean()
+    pairs = np.random.default_rng(0).integers(len(coords), size=(1000, 2))
+    pair_length = np.linalg.norm(coords[pairs[:, 0]] - coords[pairs[:, 1]], axis=1).mean()
+    
+    assert edge_length < 0.2 * pair_length
+
+
+def test_barnes_hut_approximates_exact_repulsion():
+    rng = np.random.default_rng(0)
+    pos = np.concatenate([rng.normal(0, 0.05, (1000, 2)), rng.normal(1, 0.05, (1000, 2))])
+    mass = np.ones(len(pos))
+    
+    exact = _exact_repulsion(pos, mass, 0.02)
+    approx = _barnes_hut_repulsion(pos, mass, 0.02)
+    
+    assert np.linalg.norm(exact - approx) < 0.15 * np.linalg.norm(exact)
+
+
+def test_cached_layout_reuses_positions():
+    cache = ArrayCache()
+    G = nx.path_graph(20)
+    
+    first = cached_layout(G, seed=1, cache=cache)
+    second = cached_layout(G, seed=1, cache=cache)
+    
+    assert cache.hits == 1
+    assert all(np.array_equal(first[n], second[n]) for n in G)
+    assert graph_fingerprint(G) != graph_fingerprint(nx.cycle_graph(20))
+
+
+def test_cached_layout_persists_only_with_a_cache_dir(tmp_path):
+    G = nx.relabel_nodes(nx.cycle_graph(12), lambda n: f'v{n}')
+    
+    memory = ArrayCache()
+    cached_layout(G, seed=1, cache=memory)
+    assert memory.cache_dir is None and not any(tmp_path.iterdir())
+    
+    first = cached_layout(G, seed=1, cache=ArrayCache(cache_dir=str(tmp_path)))
+    reloaded = ArrayCache(cache_dir=str(tmp_path))
+    second = cached_layout(G, seed=1, cache=reloaded)
+    
+    assert reloaded.hits == 1 and len(list(tmp_path.iterdir())) == 1
+    assert all(np.array_equal(first[n], second[n]) for n in G)
+    assert set(cached_layout(as_csr(G), seed=1, cache=memory)) == set(G)
\ No newline at end of file
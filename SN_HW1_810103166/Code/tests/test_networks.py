@@ -1,10 +1,12 @@
 import pytest
 import networkx as nx
+import numpy as np
 from src.networks import (
     create_1d_lattice,
     create_2d_lattice,
     create_3d_lattice,
-    create_random_network
+    create_random_network,
+    sample_gnp_edges
 )
 
 
@@ -51,4 +53,63 @@ def test_random_network_node_count():
 
 def test_random_network_connectivity():
     G = create_random_network(200)
-    assert nx.is_connected(G)
\ No newline at end of file
+    assert nx.is_connected(G)
+
+def test_1d_lattice_csr_backend():
+    G = create_1d_lattice(100, k=4, backend='csr')
+    assert G.number_of_nodes() == 100
+    assert G.number_of_edges() == 200
+    assert all(G.degree() == 4)
+
+
+def test_2d_lattice_csr_matches_networkx():
+    G, _ = create_2d_lattice(25, backend='csr')
+    reference = nx.convert_node_labels_to_integers(
+        nx.grid_2d_graph(5, 5, periodic=True), ordering='sorted')
+    assert set(map(frozenset, G.edges().tolist())) == set(map(frozenset, reference.edges()))
+
+
+def test_3d_lattice_open_boundaries():
+    G, _ = create_3d_lattice(27, backend='csr')
+    degrees = G.degree()
+    assert degrees.min() == 3
+    assert degrees.max() == 6
+    assert G.is_connected()
+
+
+def test_lattice_invalid_backend():
+    with pytest.raises(ValueError):
+        create_1d_lattice(10, backend='igraph')
+
+
+
+def test_gnp_edges_are_unique_and_in_range():
+    edges = sample_gnp_edges(300, 0.05, seed=0)
+    assert edges.dtype == np.int64
+    assert np.all(edges[:, 0] > edges[:, 1])
+    assert np.all(edges[:, 1] >= 0)
+    assert len(np.unique(edges[:, 0] * 300 + edges[:, 1])) == len(edges)
+
+
+def test_gnp_edge_count_matches_expectation():
+    N, p = 2000, 0.002
+    edges = sample_gnp_edges(N, p, seed=1)
+    expected = p * N * (N - 1) / 2
+    assert abs(len(edges) - expected) < 5 * np.sqrt(expected)
+
+
+def test_gnp_extreme_probabilities():
+    assert len(sample_gnp_edges(20, 0.0)) == 0
+    assert len(sample_gnp_edges(20, 1.0)) == 190
+
+
+def test_gnp_is_seedable():
+    a = sample_gnp_edges(500, 0.01, seed=np.random.default_rng(7))
+    b = sample_gnp_edges(500, 0.01, seed=np.random.default_rng(7))
+    assert np.array_equal(a, b)
+
+
+def test_random_network_csr_backend():
+    G = create_random_network(1000, seed=3, backend='csr')
+    assert G.number_of_nodes() == 1000
+    assert G.is_connected()
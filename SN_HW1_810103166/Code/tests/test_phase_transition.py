@@ -1,10 +1,17 @@
 import pytest
+import networkx as nx
 import numpy as np
 from src.phase_transition import (
     simulate_erdos_renyi_evolution,
     phase_transition_analysis,
-    finite_size_analysis
+    finite_size_analysis,
+    analyze_divergence_at_criticality,
+    adaptive_phase_transition_analysis,
+    newman_ziff_sweep,
+    percolation_curves
 )
+from src.networks import random_edge_sequence
+from src.simulation_store import SimulationStore
 
 
 def test_simulate_erdos_renyi_basic():
@@ -29,7 +36,7 @@ def test_phase_transition_above_critical():
 
 
 def test_phase_transition_analysis_structure():
-    results = phase_transition_analysis(N=100, k_min=0, k_max=2, 
+    results = phase_transition_analysis(N=100, k_min=0, k_max=2,
                                        step_coarse=0.5, num_realizations=5)
     
     assert 'k_values' in results
@@ -46,4 +53,124 @@ def test_finite_size_analysis():
     
     assert len(results) == len(N_values)
     for N in N_values:
-        assert len(results[N]) == len(k_values)
\ No newline at end of file
+        assert len(results[N]) == len(k_values)
+
+
+def test_simulate_erdos_renyi_is_seedable():
+    a = simulate_erdos_renyi_evolution(200, 1.0, num_realizations=5, seed=11, store=SimulationStore())
+    b = simulate_erdos_renyi_evolution(200, 1.0, num_realizations=5, seed=11, store=SimulationStore())
+    assert a == b
+
+
+def test_newman_ziff_sweep_giant_is_monotone():
+    giant, avg_small = newman_ziff_sweep(200, 1000, seed=0)
+    assert len(giant) == 1001
+    assert giant[0] == 1
+    assert np.all(np.diff(giant) >= 0)
+    assert giant[-1] <= 200
+    assert avg_small[0] == 0
+
+
+def test_newman_ziff_sweep_matches_component_sizes():
+    N = 150
+    giant, avg_small = newman_ziff_sweep(N, 400, seed=4)
+    edges = random_edge_sequence(N, 400, seed=4)
+    
+    for i in (0, 37, 75, 120, 200, 400):
+        G = nx.empty_graph(N)
+        G.add_edges_from(edges[:i].tolist())
+        sizes = np.array([len(c) for c in nx.connected_components(G)])
+        small = sizes[sizes < sizes.max()]
+        
+        assert giant[i] == sizes.max()
+        assert avg_small[i] == pytest.approx(small.mean() if len(small) else 0)
+
+
+def test_newman_ziff_sweep_complete_graph():
+    giant, _ = newman_ziff_sweep(30, 10 ** 6, seed=1)
+    assert len(giant) == 30 * 29 // 2 + 1
+    assert giant[-1] == 30
+
+
+def test_percolation_curves_match_direct_simulation():
+    k_values = [0.5, 2.0]
+    store = SimulationStore()
+    curves = percolation_curves(300, k_values, num_realizations=200, seed=2, store=store)
+    for k, order_parameter in zip(k_values, curves['order_parameter']):
+        direct = simulate_erdos_renyi_evolution(300, k, num_realizations=200, seed=3, store=store)
+        assert abs(order_parameter - direct['order_parameter']) < 0.03
+
+
+def test_analyses_share_cached_ensembles():
+    store = SimulationStore()
+    k_values = np.array([0.8, 1.0, 1.2])
+    
+    finite = finite_size_analysis(k_values, [100, 200], num_realizations=5, seed=4, store=store)
+    misses = store.misses
+    divergence = analyze_divergence_at_criticality([100, 200], k_range=0.2, num_points=3,
+                                                   num_realizations=5, seed=4, store=store)
+    
+    assert store.misses == misses
+    for N in [100, 200]:
+        assert np.allclose(finite[N], divergence[N]['order_parameter'])
+
+
+def test_unseeded_runs_bypass_the_store():
+    store = SimulationStore()
+    percolation_curves(120, [0.5, 1.5], num_realizations=3, store=store)
+    simulate_erdos_renyi_evolution(100, 1.0, num_realizations=3, store=store)
+    
+    assert store.hits == store.misses == 0
+
+
+def test_longer_sweep_preserves_cached_prefix():
+    store = SimulationStore()
+    short = percolation_curves(150, [0.5, 1.0], num_realizations=4, seed=8, store=store)
+    longer = percolation_curves(150, [0.5, 1.0, 4.0], num_realizations=4, seed=8, store=store)
+    assert np.array_equal(short['order_parameter'], longer['order_parameter'][:2])
+
+
+def test_phase_transition_grid_does_not_drift():
+    results = phase_transition_analysis(N=100, k_min=0, k_max=2, step_coarse=0.1,
+                                        step_fine=0.02, critical_window=(0.8, 1.2),
+                                        num_realizations=2)
+    k_values = list(results['k_values'])
+    assert 0.8 in k_values
+    assert 1.2 in k_values
+    assert k_values[-1] == 1.92
+    assert all(k == round(k, 10) for k in k_values)
+
+
+def test_adaptive_grid_concentrates_near_critical_point():
+    results = adaptive_phase_transition_analysis(N=2000, k_min=0, k_max=4, max_points=60,
+                                                 num_realizations=10, seed=0,
+                                                 store=SimulationStore())
+    k_values = results['k_values']
+    assert len(k_values) <= 60
+    assert np.all(np.diff(k_values) > 0)
+    assert len(results['order_parameter_err']) == len(k_values)
+    
+    spacing = np.diff(k_values)
+    near = spacing[(k_values[:-1] > 0.8) & (k_values[:-1] < 1.3)]
+    far = spacing[k_values[:-1] > 2.5]
+    assert near.mean() < far.mean()
+    assert 0.8 < results['critical_point'] < 1.5
+
+
+def test_simulate_erdos_renyi_reports_realizations_and_sem():
+    result = simulate_erdos_renyi_evolution(100, 2.0, num_realizations=8)
+    assert result['realizations'] == 8
+    assert result['order_parameter_sem'] >= 0
+
+
+def test_adaptive_realizations_stop_early_far_from_critical():
+    result = simulate_erdos_renyi_evolution(2000, 4.0, num_realizations=100,
+                                            tolerance=0.01, min_realizations=5)
+    assert 5 <= result['realizations'] < 100
+    assert result['order_parameter_sem'] < 0.01
+
+
+def test_adaptive_realizations_respect_maximum():
+    result = simulate_erdos_renyi_evolution(200, 1.0, num_realizations=12,
+                                            tolerance=1e-9, min_realizations=5)
+    assert result['realizations'] == 12
@@ -0,0 +1,46 @@
+import pytest
+import numpy as np
+from src.simulation_store import SimulationStore
+
+
+def test_key_is_order_independent():
+    assert SimulationStore.key(N=10, k=1.0) == SimulationStore.key(k=1.0, N=10)
+    assert SimulationStore.key(N=10, k=1.0) != SimulationStore.key(N=10, k=2.0)
+
+
+def test_get_or_compute_runs_once():
+    store = SimulationStore()
+    calls = []
+    
+    def compute():
+        calls.append(1)
+        return {'values': np.arange(3)}
+    
+    key = store.key(N=5)
+    store.get_or_compute(key, compute)
+    result = store.get_or_compute(key, compute)
+    
+    assert len(calls) == 1
+    assert np.array_equal(result['values'], np.arange(3))
+
+
+def test_memory_tier_evicts_least_recently_used():
+    store = SimulationStore(max_entries=2)
+    store.put('a', {'x': np.zeros(1)})
+    store.put('b', {'x': np.zeros(1)})
+    store.get('a')
+    store.put('c', {'x': np.zeros(1)})
+    
+    assert store.get('b') is None
+    assert store.get('a') is not None
+
+
+def test_disk_tier_survives_new_store(tmp_path):
+    first = SimulationStore(cache_dir=str(tmp_path))
+    first.put('key', {'giant': np.linspace(0, 1, 5)})
+    
+    second = SimulationStore(cache_dir=str(tmp_path))
+    arrays = second.get('key')
+    
+    assert np.allclose(arrays['giant'], np.linspace(0, 1, 5))
+    assert second.hits == 1
\ No newline at end of file
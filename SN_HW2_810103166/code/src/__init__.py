@@ -1,3 +1,10 @@
+import os
+import sys
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
 from .question1.centrality import *
 from .question1.analysis import *
 from .question1.bottlenecks import *
@@ -9,3 +16,5 @@ from .question2.ranking import *
 from .question2.analysis import *
 from .question2.stability import *
 from .question2.visualization import *
+
+from .export import export_figures
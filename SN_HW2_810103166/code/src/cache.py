@@ -0,0 +1 @@
+from sn_common.cache import ArrayCache
@@ -0,0 +1,2 @@
+from sn_common.graph import (CSRGraph, as_csr, as_networkx, ego_graph, graph_fingerprint, index_dtype,
+                             node_degrees, row_offsets)
@@ -11,10 +11,18 @@ from .analysis import (
 )
 
 from .bottlenecks import (
+    approximate_betweenness,
+    brandes_scores,
     calculate_betweenness_centrality,
+    calculate_edge_betweenness,
     rank_gap_analysis
 )
 
+from .traversal import (
+    traversal_summary,
+    calculate_eccentricity
+)
+
 from .efficiency import (
     identify_efficient_monitors,
     extract_ego_network
@@ -1,24 +1,65 @@
-import networkx as nx
+import inspect
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.linalg import cg, eigs, eigsh, gmres
 
+from ..graph import as_csr
 
-def calculate_bonacich_power(G, beta=0, alpha=1):
-    A = nx.adjacency_matrix(G).todense()
+
+TOL_KEYWORD = 'rtol' if 'rtol' in inspect.signature(cg).parameters else 'tol'
+
+
+def spectral_radius(A, symmetric=None):
+    A = A.astype(np.float64)
     n = A.shape[0]
-    I = np.eye(n)
+    if symmetric is None:
+        symmetric = (A != A.T).nnz == 0
     
-    if beta == 0:
-        centrality = np.array(np.sum(A, axis=1)).flatten()
+    if n < 3:
+        return float(np.abs(np.linalg.eigvals(A.toarray())).max()) if n else 0.0
+    if symmetric:
+        values = eigsh(A, k=1, which='LM', return_eigenvectors=False, tol=1e-6)
     else:
-        try:
-            inv_matrix = np.linalg.inv(I - beta * A)
-            centrality = np.array(alpha * inv_matrix @ np.ones((n, 1))).flatten()
-        except np.linalg.LinAlgError:
-            centrality = np.array(np.sum(A, axis=1)).flatten()
+        values = eigs(A, k=1, which='LM', return_eigenvectors=False, tol=1e-6)
+    
+    return float(np.abs(values).max())
+
+
+def _power_system(G):
+    G = as_csr(G, weight='weight')
+    A = G.to_scipy().astype(np.float64)
+    symmetric = (A != A.T).nnz == 0
+    return G.node_list(), A, symmetric
+
+
+def solve_bonacich(A, beta, alpha=1, rho=None, symmetric=None, x0=None, tol=1e-10, max_iter=None):
+    n = A.shape[0]
+    if beta == 0:
+        return np.asarray(A.sum(axis=1)).flatten()
+    
+    if symmetric is None:
+        symmetric = (A != A.T).nnz == 0
+    if rho is None:
+        rho = spectral_radius(A, symmetric)
+    if abs(beta) * rho >= 1:
+        raise ValueError(f"Bonacich power diverges for beta={beta}: |beta| must be below 1/rho = {1 / rho:.6g}")
+    
+    M = sp.identity(n, format='csr') - beta * A
+    solver = cg if symmetric else gmres
+    centrality, info = solver(M, alpha * np.ones(n), x0=x0, maxiter=max_iter, atol=0.0, **{TOL_KEYWORD: tol})
+    
+    if info != 0:
+        raise RuntimeError(f"Bonacich solver did not converge for beta={beta}")
+    
+    return centrality
+
+
+def calculate_bonacich_power(G, beta=0, alpha=1):
+    nodes, A, symmetric = _power_system(G)
+    centrality = solve_bonacich(A, beta, alpha, symmetric=symmetric)
     
-    nodes = list(G.nodes())
-    result = {nodes[i]: float(centrality[i]) for i in range(n)}
+    result = {nodes[i]: float(centrality[i]) for i in range(len(nodes))}
     
     return result
 
@@ -27,22 +68,26 @@ def analyze_power_regimes(G, beta_values=None):
     if beta_values is None:
         beta_values = [0, 0.01, -0.01]
     
+    nodes, A, symmetric = _power_system(G)
+    rho = spectral_radius(A, symmetric) if any(beta != 0 for beta in beta_values) else None
     results = {}
     
+    previous = None
     for beta in beta_values:
-        power = calculate_bonacich_power(G, beta=beta)
+        power = solve_bonacich(A, beta, rho=rho, symmetric=symmetric, x0=previous)
+        if beta != 0:
+            previous = power
         results[f'power_{beta}'] = power
     
-    nodes = list(G.nodes())
     df = pd.DataFrame(index=nodes)
     
     for beta in beta_values:
         power_col = f'power_{beta}'
-        df[power_col] = pd.Series(results[power_col])
+        df[power_col] = results[power_col]
     
     for beta in beta_values:
         power_col = f'power_{beta}'
         rank_col = f'rank_{beta}'
         df[rank_col] = df[power_col].rank(ascending=False)
     
-    return df
\ No newline at end of file
+    return df
@@ -1,15 +1,206 @@
-import networkx as nx
+import numpy as np
 import pandas as pd
 
+from ..graph import as_csr, node_degrees, row_offsets
+from .traversal import (_bfs_levels, betweenness_from_summary, brandes_scores, closeness_from_summary,
+                        traversal_summary)
 
-def calculate_betweenness_centrality(G):
-    return nx.betweenness_centrality(G, normalized=True)
 
+def calculate_betweenness_centrality(G, normalized=True, workers=1, progress=None):
+    summary = traversal_summary(G, workers=workers, progress=progress)
+    return betweenness_from_summary(summary, normalized=normalized)
 
-def rank_gap_analysis(G, top_n=10):
-    betweenness = calculate_betweenness_centrality(G)
-    degree = dict(G.degree())
-    closeness = nx.closeness_centrality(G)
+
+def calculate_edge_betweenness(G, normalized=True, workers=1, progress=None):
+    csr, _, scores = brandes_scores(G, workers=workers, edges=True, progress=progress)
+    n = csr.number_of_nodes()
+    nodes = csr.node_list()
+    
+    pairs = csr.edges().astype(np.int64)
+    if csr.is_directed():
+        values = scores
+    else:
+        rows = np.repeat(np.arange(n, dtype=np.int64), csr.degree())
+        keys = np.minimum(rows, csr.indices) * n + np.maximum(rows, csr.indices)
+        position = np.searchsorted(pairs[:, 0] * n + pairs[:, 1], keys)
+        values = np.bincount(position, scores, len(pairs))
+    
+    if normalized and n > 1:
+        values = values / (n * (n - 1))
+    elif not normalized and not csr.is_directed():
+        values = values / 2
+    
+    return {(nodes[u], nodes[v]): value for (u, v), value in zip(pairs.tolist(), values.tolist())}
+
+
+def _walk(adjacency, dist, sigma, start, end, rng):
+    indptr, indices = adjacency
+    path = []
+    while start != end:
+        neighbors = indices[indptr[start]:indptr[start + 1]]
+        neighbors = neighbors[dist[neighbors] == dist[start] - 1]
+        weights = np.cumsum(sigma[neighbors])
+        start = neighbors[np.searchsorted(weights, rng.random() * weights[-1], side='right')]
+        path.append(start)
+    return path[:-1]
+
+
+def _sample_path(adjacency, degrees, dist, sigma, s, t, rng):
+    frontiers, levels, touched = [np.array([s]), np.array([t])], [0, 0], [s, t]
+    dist[0, s] = dist[1, t] = 0
+    sigma[0, s] = sigma[1, t] = 1.0
+    
+    interior = None
+    while interior is None:
+        costs = [degrees[0][frontiers[0]].sum(), degrees[1][frontiers[1]].sum()]
+        if min(costs) == 0:
+            break
+        side = 0 if costs[0] <= costs[1] else 1
+        indptr, indices = adjacency[side]
+        
+        offsets, counts = row_offsets(indptr, frontiers[side])
+        targets = indices[offsets]
+        weights = np.repeat(sigma[side, frontiers[side]], counts)
+        fresh = dist[side, targets] < 0
+        if not fresh.any():
+            break
+        
+        nodes, inverse = np.unique(targets[fresh], return_inverse=True)
+        levels[side] += 1
+        dist[side, nodes] = levels[side]
+        sigma[side, nodes] = np.bincount(inverse, weights[fresh])
+        frontiers[side] = nodes
+        touched.extend(nodes.tolist())
+        
+        meet = nodes[dist[1 - side, nodes] >= 0]
+        if len(meet):
+            weight = np.cumsum(sigma[0, meet] * sigma[1, meet])
+            middle = meet[np.searchsorted(weight, rng.random() * weight[-1], side='right')]
+            interior = ([middle] + _walk(adjacency[1], dist[0], sigma[0], middle, s, rng) +
+                        _walk(adjacency[0], dist[1], sigma[1], middle, t, rng))
+            interior = [v for v in interior if v != s and v != t]
+    
+    dist[:, touched] = -1
+    sigma[:, touched] = 0.0
+    return interior or []
+
+
+def _vertex_diameter_bound(csr):
+    n = csr.number_of_nodes()
+    if csr.is_directed() or not csr.is_connected():
+        return n
+    levels = _bfs_levels(csr.indptr, csr.indices, np.array([int(np.argmax(csr.degree()))]),
+                         np.full(n, -1, dtype=np.int32), np.zeros(n))
+    return min(n, 2 * (len(levels) - 1) + 1)
+
+
+def approximate_betweenness(G, top_k=10, epsilon=0.01, delta=0.1, batch=1000, max_samples=None, seed=None):
+    csr = as_csr(G)
+    n = csr.number_of_nodes()
+    rng = np.random.default_rng(seed)
+    
+    out_edges = (csr.indptr.astype(np.int64), csr.indices.astype(np.int64))
+    transpose = csr.transpose()
+    adjacency = (out_edges, (transpose.indptr.astype(np.int64), transpose.indices.astype(np.int64)))
+    degrees = (np.diff(adjacency[0][0]), np.diff(adjacency[1][0]))
+    
+    scale = n / (n - 2) if n > 2 else 1.0
+    tolerance = epsilon / scale
+    
+    diameter = _vertex_diameter_bound(csr)
+    vc_dimension = int(np.floor(np.log2(diameter - 2))) + 1 if diameter > 3 else 1
+    limit = int(np.ceil(0.5 / tolerance ** 2 * (vc_dimension + np.log(2 / delta))))
+    limit = limit if max_samples is None else min(limit, max_samples)
+    rounds = int(np.ceil(np.log2(max(limit / batch, 1)))) + 1
+    confidence = np.log(3 * n * rounds * 2 / delta)
+    
+    dist = np.full((2, n), -1, dtype=np.int64)
+    sigma = np.zeros((2, n))
+    counts = np.zeros(n)
+    samples = 0
+    
+    while True:
+        target = min(limit, max(batch, 2 * samples))
+        sources = rng.integers(n, size=target - samples)
+        targets = (sources + rng.integers(1, max(n, 2), size=target - samples)) % n
+        visits = []
+        for s, t in zip(sources.tolist(), targets.tolist()):
+            visits.extend(_sample_path(adjacency, degrees, dist, sigma, s, t, rng))
+        counts += np.bincount(np.asarray(visits, dtype=np.int64), minlength=n)
+        samples = target
+        
+        p = counts / samples
+        radius = np.sqrt(2 * p * (1 - p) * confidence / samples) + 3 * confidence / samples
+        lower, upper = np.maximum(p - radius, 0.0), p + radius
+        
+        order = np.argsort(-p, kind='stable')
+        k = min(top_k, n)
+        below = np.maximum.accumulate(upper[order][::-1])[::-1]
+        below = np.append(below[1:], 0.0)
+        
+        separated = k == n or lower[order[k - 1]] > below[k - 1]
+        if separated or samples >= limit or radius[order[:k]].max() <= tolerance:
+            break
+    
+    above = np.append(np.inf, lower[order][:-1])
+    certified = (upper[order] < above) & (lower[order] > below)
+    nodes = csr.node_list()
+    
+    df = pd.DataFrame({
+        'node': [nodes[i] for i in order],
+        'betweenness': p[order] * scale,
+        'lower': lower[order] * scale,
+        'upper': upper[order] * scale,
+        'rank': np.arange(1, n + 1),
+        'rank_certified': certified,
+        'top_k_certified': np.arange(n) < k if separated else np.zeros(n, dtype=bool)
+    })
+    df.attrs['samples'] = samples
+    return df
+
+
+def _closeness_of(csr, sources):
+    n = csr.number_of_nodes()
+    incoming = csr.transpose() if csr.is_directed() else csr
+    B = len(sources)
+    levels = _bfs_levels(incoming.indptr, incoming.indices, sources,
+                         np.full(n * B, -1, dtype=np.int32), np.zeros(n * B))
+    
+    columns = np.concatenate(levels) % B
+    depths = np.repeat(np.arange(len(levels)), [len(keys) for keys in levels])
+    reach = np.bincount(columns, minlength=B)
+    total = np.bincount(columns, depths, B)
+    
+    closeness = np.divide(reach - 1, total, out=np.zeros(B), where=total > 0)
+    return closeness * (reach - 1) / (n - 1) if n > 1 else closeness
+
+
+def _approximate_rank_gaps(G, top_n, epsilon, delta, seed):
+    csr = as_csr(G)
+    estimates = approximate_betweenness(csr, top_k=top_n, epsilon=epsilon, delta=delta, seed=seed).head(top_n)
+    degree = pd.Series(node_degrees(csr))
+    
+    df = estimates[['node', 'betweenness', 'lower', 'upper']].copy()
+    df['degree'] = degree[df['node']].values
+    df['closeness'] = _closeness_of(csr, np.array([csr.index(node) for node in df['node']], dtype=np.int64))
+    df['bet_rank'] = estimates['rank'].astype(float)
+    df['deg_rank'] = degree.rank(ascending=False)[df['node']].values
+    df['rank_certified'] = estimates['rank_certified']
+    df['top_k_certified'] = estimates['top_k_certified']
+    
+    return df
+
+
+def rank_gap_analysis(G, top_n=10, workers=1, method='exact', epsilon=0.01, delta=0.1, seed=None):
+    if method == 'approximate':
+        return _approximate_rank_gaps(G, top_n, epsilon, delta, seed)
+    if method != 'exact':
+        raise ValueError("method must be 'exact' or 'approximate'")
+    
+    summary = traversal_summary(G, workers=workers)
+    betweenness = betweenness_from_summary(summary)
+    closeness = closeness_from_summary(summary)
+    degree = node_degrees(G)
     
     df = pd.DataFrame({
         'node': list(betweenness.keys()),
@@ -1,15 +1,31 @@
 import networkx as nx
 import numpy as np
+import scipy.sparse.linalg as sla
+
+from ..graph import CSRGraph
+from .traversal import closeness_from_summary, traversal_summary
 
 
 def calculate_normalized_degree(G):
+    if isinstance(G, CSRGraph):
+        return dict(zip(G.node_list(), (G.degree() / (G.number_of_nodes() - 1)).tolist()))
+    
     degrees = dict(G.degree())
     n = G.number_of_nodes()
     normalized = {node: deg / (n - 1) for node, deg in degrees.items()}
     return normalized
 
 
+def _eigenvector_csr(G):
+    A = G.transpose().to_scipy().astype(np.float64)
+    _, vectors = sla.eigs(A, k=1, which='LR')
+    vector = np.abs(vectors[:, 0].real)
+    return dict(zip(G.node_list(), (vector / np.linalg.norm(vector)).tolist()))
+
+
 def calculate_eigenvector_centrality(G, max_iter=1000):
+    if isinstance(G, CSRGraph):
+        return _eigenvector_csr(G)
     try:
         return nx.eigenvector_centrality(G, max_iter=max_iter)
     except:
@@ -17,9 +33,7 @@ def calculate_eigenvector_centrality(G, max_iter=1000):
 
 
 def calculate_closeness_centrality(G):
-    if not nx.is_connected(G):
-        return nx.closeness_centrality(G)
-    return nx.closeness_centrality(G)
+    return closeness_from_summary(traversal_summary(G))
 
 
 def calculate_all_centralities(G):
@@ -1,12 +1,14 @@
-import networkx as nx
 import pandas as pd
 
+from ..graph import ego_graph, node_degrees
+from .traversal import closeness_from_summary, traversal_summary
+
 
 def identify_efficient_monitors(G, top_closeness=20, degree_threshold=100):
-    degree = dict(G.degree())
-    closeness = nx.closeness_centrality(G)
+    closeness = closeness_from_summary(traversal_summary(G))
+    degree = node_degrees(G)
     
-    n = G.number_of_nodes()
+    n = len(degree)
     norm_degree = {node: deg / (n - 1) for node, deg in degree.items()}
     
     df = pd.DataFrame({
@@ -28,5 +30,4 @@ def identify_efficient_monitors(G, top_closeness=20, degree_threshold=100):
 
 
 def extract_ego_network(G, node):
-    ego = nx.ego_graph(G, node)
-    return ego
+    return ego_graph(G, node)
@@ -0,0 +1 @@
+from sn_common.layout import LAYOUT_CACHE, cached_layout, force_directed_layout
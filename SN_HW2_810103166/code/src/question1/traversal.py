@@ -0,0 +1,209 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from ..cache import ArrayCache
+from ..graph import as_csr, row_offsets
+
+
+BLOCK_BYTES = 1 << 27
+FIELDS = ('betweenness', 'distance_sum', 'reach', 'eccentricity')
+SHARED_ARRAYS = ('indptr', 'indices', 'T_indptr', 'T_indices', 'T_edges')
+
+TRAVERSAL_CACHE = ArrayCache(cache_dir=os.environ.get('SN_TRAVERSAL_CACHE'), max_entries=8)
+
+_SHARED = {}
+
+
+def _transpose_arrays(indptr, indices):
+    N = len(indptr) - 1
+    rows = np.repeat(np.arange(N, dtype=np.int64), np.diff(indptr))
+    order = np.lexsort((rows, indices))
+    
+    T_indptr = np.zeros(N + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=N), out=T_indptr[1:])
+    return T_indptr, rows[order], order
+
+
+def _bfs_levels(indptr, indices, sources, dist, sigma):
+    B = len(sources)
+    keys = np.asarray(sources, dtype=np.int64) * B + np.arange(B)
+    dist[keys] = 0
+    sigma[keys] = 1.0
+    
+    levels = [keys]
+    while True:
+        offsets, counts = row_offsets(indptr, keys // B)
+        targets = indices[offsets].astype(np.int64) * B + np.repeat(keys % B, counts)
+        paths = np.repeat(sigma[keys], counts)
+        fresh = dist[targets] < 0
+        if not fresh.any():
+            return levels
+        
+        keys, inverse = np.unique(targets[fresh], return_inverse=True)
+        dist[keys] = len(levels)
+        sigma[keys] = np.bincount(inverse, paths[fresh])
+        levels.append(keys)
+
+
+def _accumulate(transpose, levels, B, dist, sigma, delta, slot, edges=False):
+    T_indptr, T_indices, T_edges = transpose
+    for keys in levels:
+        slot[keys] = np.arange(len(keys))
+    
+    edge_positions, edge_values = [], []
+    for depth in range(len(levels) - 1, 0, -1):
+        keys = levels[depth]
+        coefficient = (1 + delta[keys]) / sigma[keys]
+        
+        offsets, counts = row_offsets(T_indptr, keys // B)
+        predecessors = T_indices[offsets] * B + np.repeat(keys % B, counts)
+        on_path = dist[predecessors] == depth - 1
+        
+        predecessors = predecessors[on_path]
+        contribution = sigma[predecessors] * np.repeat(coefficient, counts)[on_path]
+        previous = levels[depth - 1]
+        delta[previous] += np.bincount(slot[predecessors], contribution, len(previous))
+        if edges:
+            edge_positions.append(T_edges[offsets][on_path])
+            edge_values.append(contribution)
+    
+    if not edges:
+        return None
+    if not edge_positions:
+        return np.zeros(len(T_edges))
+    return np.bincount(np.concatenate(edge_positions), np.concatenate(edge_values), len(T_edges))
+
+
+def _traverse_sources(indptr, indices, transpose, sources, block_size, edges, progress=None):
+    N = len(indptr) - 1
+    result = {field: np.zeros(N) for field in FIELDS}
+    result['edge_betweenness'] = np.zeros(len(indices)) if edges else None
+    
+    dist = np.full(N * block_size, -1, dtype=np.int32)
+    sigma = np.zeros(N * block_size)
+    delta = np.zeros(N * block_size)
+    slot = np.zeros(N * block_size, dtype=np.int64)
+    
+    starts = range(0, len(sources), block_size)
+    for done, start in enumerate(starts, 1):
+        block = sources[start:start + block_size]
+        B = len(block)
+        levels = _bfs_levels(indptr, indices, block, dist, sigma)
+        edge_scores = _accumulate(transpose, levels, B, dist, sigma, delta, slot, edges)
+        if edges:
+            result['edge_betweenness'] += edge_scores
+        
+        touched = np.concatenate(levels)
+        nodes = touched // B
+        depths = np.repeat(np.arange(len(levels)), [len(keys) for keys in levels])
+        result['reach'] += np.bincount(nodes, minlength=N)
+        result['distance_sum'] += np.bincount(nodes, depths, N)
+        result['betweenness'] += np.bincount(nodes, np.where(depths > 0, delta[touched], 0.0), N)
+        for depth, keys in enumerate(levels):
+            result['eccentricity'][block[keys % B]] = depth
+        
+        dist[touched] = -1
+        sigma[touched] = 0.0
+        delta[touched] = 0.0
+        if progress is not None:
+            progress(done, len(starts))
+    
+    return result
+
+
+def _attach_shared(names, shapes, dtypes):
+    for key, name, shape, dtype in zip(SHARED_ARRAYS, names, shapes, dtypes):
+        block = shared_memory.SharedMemory(name=name)
+        _SHARED[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+
+def _traverse_range(sources, block_size, edges):
+    arrays = [_SHARED[key][1] for key in SHARED_ARRAYS]
+    return _traverse_sources(arrays[0], arrays[1], tuple(arrays[2:]), sources, block_size, edges)
+
+
+def _share(array):
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return block
+
+
+def traverse(G, sources=None, workers=1, edges=False, progress=None, block_size=None):
+    csr = as_csr(G)
+    N = csr.number_of_nodes()
+    indptr, indices = csr.indptr, csr.indices
+    sources = np.arange(N) if sources is None else np.asarray(sources)
+    block_size = block_size or int(np.clip(BLOCK_BYTES // (32 * max(N, 1)), 1, 256))
+    transpose = _transpose_arrays(indptr, indices)
+    
+    ranges = [chunk for chunk in np.array_split(sources, min(workers, max(len(sources), 1))) if len(chunk)]
+    if workers == 1 or len(ranges) <= 1:
+        return csr, _traverse_sources(indptr, indices, transpose, sources, block_size, edges, progress)
+    
+    totals = {field: np.zeros(N) for field in FIELDS}
+    totals['edge_betweenness'] = np.zeros(len(indices)) if edges else None
+    
+    arrays = (indptr, indices) + transpose
+    blocks = [_share(array) for array in arrays]
+    try:
+        initargs = ([b.name for b in blocks], [a.shape for a in arrays], [a.dtype for a in arrays])
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared, initargs=initargs) as executor:
+            futures = [executor.submit(_traverse_range, chunk, block_size, edges) for chunk in ranges]
+            for done, future in enumerate(as_completed(futures), 1):
+                for field, values in future.result().items():
+                    if values is not None:
+                        totals[field] += values
+                if progress is not None:
+                    progress(done, len(ranges))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    
+    return csr, totals
+
+
+def brandes_scores(G, sources=None, workers=1, edges=False, progress=None, block_size=None):
+    csr, totals = traverse(G, sources=sources, workers=workers, edges=edges, progress=progress, block_size=block_size)
+    return csr, totals['betweenness'], totals['edge_betweenness']
+
+
+def traversal_summary(G, workers=1, progress=None, cache=None):
+    cache = TRAVERSAL_CACHE if cache is None else cache
+    csr = as_csr(G)
+    key = ArrayCache.key(csr, kind='traversal', directed=csr.is_directed())
+    
+    def compute():
+        _, totals = traverse(csr, workers=workers, progress=progress)
+        return np.vstack([totals[field] for field in FIELDS])
+    
+    summary = dict(zip(FIELDS, cache.get_or_compute(key, compute)))
+    summary['nodes'] = csr.node_list()
+    summary['directed'] = csr.is_directed()
+    return summary
+
+
+def closeness_from_summary(summary):
+    n = len(summary['nodes'])
+    reach, total = summary['reach'], summary['distance_sum']
+    closeness = np.divide(reach - 1, total, out=np.zeros(n), where=total > 0)
+    if n > 1:
+        closeness *= (reach - 1) / (n - 1)
+    return dict(zip(summary['nodes'], closeness.tolist()))
+
+
+def betweenness_from_summary(summary, normalized=True):
+    n = len(summary['nodes'])
+    scores = summary['betweenness'].copy()
+    if normalized and n > 2:
+        scores /= (n - 1) * (n - 2)
+    elif not normalized and not summary['directed']:
+        scores /= 2
+    return dict(zip(summary['nodes'], scores.tolist()))
+
+
+def calculate_eccentricity(G, workers=1):
+    summary = traversal_summary(G, workers=workers)
+    return dict(zip(summary['nodes'], summary['eccentricity'].astype(int).tolist()))
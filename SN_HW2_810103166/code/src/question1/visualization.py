@@ -3,10 +3,10 @@ import networkx as nx
 import os
 import numpy as np
 
+from .layout import cached_layout
+
 
 def plot_degree_eigenvector_scatter(df, save_path='results/plots/gap_analysis.png'):
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     fig, ax = plt.subplots(figsize=(10, 6))
     ax.scatter(df['degree'], df['eigenvector'], alpha=0.6, s=100, c='blue')
     ax.set_xlabel('Degree', fontsize=12)
@@ -14,13 +14,13 @@ def plot_degree_eigenvector_scatter(df, save_path='results/plots/gap_analysis.pn
     ax.set_title('Degree vs Eigenvector Centrality', fontsize=14)
     ax.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     return fig
 
 
 def plot_betweenness_ranking(df, top_n=10, save_path='results/plots/betweenness_ranking.png'):
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     fig, ax = plt.subplots(figsize=(12, 6))
     top_df = df.nsmallest(top_n, 'bet_rank')
     
@@ -33,13 +33,13 @@ def plot_betweenness_ranking(df, top_n=10, save_path='results/plots/betweenness_
     ax.set_title(f'Top {top_n} Betweenness Centrality', fontsize=14)
     ax.grid(True, alpha=0.3, axis='y')
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     return fig
 
 
 def plot_efficiency_scatter(df, save_path='results/plots/efficiency_scatter.png'):
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     fig, ax = plt.subplots(figsize=(10, 6))
     ax.scatter(df['norm_degree'], df['closeness'], alpha=0.6, s=100, c='green')
     ax.set_xlabel('Normalized Degree', fontsize=12)
@@ -47,15 +47,15 @@ def plot_efficiency_scatter(df, save_path='results/plots/efficiency_scatter.png'
     ax.set_title('Efficiency: Normalized Degree vs Closeness', fontsize=14)
     ax.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     return fig
 
 
 def plot_ego_network(G, ego_graph, central_node, save_path='results/plots/ego_network.png'):
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     fig, ax = plt.subplots(figsize=(10, 10))
-    pos = nx.spring_layout(ego_graph, k=2, iterations=50, seed=42)
+    pos = cached_layout(ego_graph, k=2, iterations=50, seed=42)
     degrees = dict(ego_graph.degree())
     node_sizes = [300 + 50 * degrees[n] for n in ego_graph.nodes()]
     node_colors = ['red' if n == central_node else 'lightblue' for n in ego_graph.nodes()]
@@ -72,13 +72,13 @@ def plot_ego_network(G, ego_graph, central_node, save_path='results/plots/ego_ne
     ax.set_title(f'Ego Network of Node {central_node}', fontsize=14)
     ax.axis('off')
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     return fig
 
 
 def plot_bonacich_trajectories(df, save_path='results/plots/bonacich_trajectories.png'):
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     fig, ax = plt.subplots(figsize=(12, 8))
     
     rank_cols = [col for col in df.columns if 'rank_' in str(col)]
@@ -98,5 +98,7 @@ def plot_bonacich_trajectories(df, save_path='results/plots/bonacich_trajectorie
     ax.invert_yaxis()
     ax.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     return fig
\ No newline at end of file
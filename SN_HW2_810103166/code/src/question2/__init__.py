@@ -1,9 +1,15 @@
 from .ranking import (
     calculate_hits,
     calculate_pagerank,
+    hits_scores,
+    pagerank_block,
+    personalized_pagerank,
+    personalized_pagerank_block,
     scores_to_ranks
 )
 
+from .incremental import IncrementalRanking
+
 from .analysis import (
     ranking_comparison,
     identify_divergent_nodes
@@ -1,13 +1,26 @@
 import pandas as pd
 import numpy as np
 
+from .incremental import IncrementalRanking
+from .ranking import descending_ranks
+
+
+def _score_frame(scores, name):
+    if isinstance(scores, dict):
+        nodes, values = list(scores.keys()), np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+    else:
+        nodes, values = scores[0], np.asarray(scores[-1], dtype=np.float64)
+    return pd.DataFrame({'node': nodes, f'{name}_score': values, f'{name}_rank': descending_ranks(values)})
+
 
 def ranking_comparison(hits_authorities, pagerank_scores):
-    hits_ranks = pd.DataFrame(list(hits_authorities.items()), columns=['node', 'authority_score'])
-    hits_ranks['authority_rank'] = hits_ranks['authority_score'].rank(ascending=False)
+    if isinstance(hits_authorities, IncrementalRanking):
+        hits_authorities = hits_authorities.hits_scores()
+    if isinstance(pagerank_scores, IncrementalRanking):
+        pagerank_scores = pagerank_scores.pagerank_scores()
     
-    pr_ranks = pd.DataFrame(list(pagerank_scores.items()), columns=['node', 'pagerank_score'])
-    pr_ranks['pagerank_rank'] = pr_ranks['pagerank_score'].rank(ascending=False)
+    hits_ranks = _score_frame(hits_authorities, 'authority')
+    pr_ranks = _score_frame(pagerank_scores, 'pagerank')
     
     comparison = hits_ranks.merge(pr_ranks, on='node')
     comparison['rank_diff'] = abs(comparison['authority_rank'] - comparison['pagerank_rank'])
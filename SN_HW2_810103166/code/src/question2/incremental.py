@@ -0,0 +1,170 @@
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+
+from ..graph import CSRGraph, as_csr, row_offsets
+from .ranking import _hits_block_power, pagerank_block
+
+
+class IncrementalRanking:
+    def __init__(self, G, alpha=0.85, tol=1e-8, check_every=10, drift_tol=1e-6, max_iter=1000):
+        csr = as_csr(G, weight='weight')
+        self.nodes = csr.node_list()
+        self.directed = csr.is_directed()
+        self.alpha = alpha
+        self.tol = tol
+        self.check_every = check_every
+        self.drift_tol = drift_tol
+        self.max_iter = max_iter
+        self.batches = 0
+        
+        self._labels = csr
+        self._graph = csr
+        self._A = csr.to_scipy().astype(np.float64)
+        self._out_weight = np.asarray(self._A.sum(axis=1)).flatten()
+        self._P = self._row_normalize(self._A, self._out_weight)
+        self._authorities = None
+        self._hits_stale = True
+        
+        _, X = pagerank_block(csr, [alpha], max_iter=max_iter, tol=tol)
+        self.scores = X[:, 0].copy()
+        self.residual = self._exact_residual()
+        self._uniform = 0.0
+    
+    @staticmethod
+    def _row_normalize(A, out_weight):
+        scale = np.divide(1.0, out_weight, out=np.zeros_like(out_weight), where=out_weight != 0)
+        return (sp.diags(scale) @ A).tocsr()
+    
+    @property
+    def graph(self):
+        if self._graph is None:
+            self._graph = CSRGraph(self._A.indptr, self._A.indices, weights=self._A.data,
+                                   nodes=self._labels.nodes, directed=self.directed)
+        return self._graph
+    
+    def _exact_residual(self):
+        N = len(self.scores)
+        dangling_mass = self.scores[self._out_weight == 0].sum()
+        spread = self._P.T @ self.scores + dangling_mass / N
+        return (1 - self.alpha) / N + self.alpha * spread - self.scores
+    
+    def _push(self, active=None):
+        N = len(self.scores)
+        P, r, x = self._P, self.residual, self.scores
+        dangling = self._out_weight == 0
+        
+        if active is None:
+            active = np.flatnonzero(np.abs(r) >= self.tol)
+        for _ in range(self.max_iter):
+            if len(active) == 0:
+                if abs(self._uniform) < self.tol:
+                    return
+                r += self._uniform
+                self._uniform = 0.0
+                active = np.flatnonzero(np.abs(r) >= self.tol)
+                continue
+            
+            pushed = r[active]
+            x[active] += pushed
+            r[active] = 0.0
+            self._uniform += self.alpha * pushed[dangling[active]].sum() / N
+            
+            offsets, counts = row_offsets(P.indptr, active)
+            touched, inverse = np.unique(P.indices[offsets], return_inverse=True)
+            r[touched] += np.bincount(inverse, self.alpha * np.repeat(pushed, counts) * P.data[offsets], len(touched))
+            active = touched[np.abs(r[touched]) >= self.tol]
+        
+        raise nx.PowerIterationFailedConvergence(self.max_iter)
+    
+    def _batch_weights(self, insertions, deletions):
+        targets = {}
+        for edge in deletions:
+            u, v = self._labels.index(edge[0]), self._labels.index(edge[1])
+            if self._A[u, v] == 0:
+                raise nx.NetworkXError(f"The edge {edge[0]}-{edge[1]} is not in the graph.")
+            targets[(u, v)] = 0.0
+        for edge in insertions:
+            u, v = self._labels.index(edge[0]), self._labels.index(edge[1])
+            if u == v:
+                raise nx.NetworkXError(f"Self-loop {edge[0]}-{edge[1]} is not supported: CSR graphs drop self-loops.")
+            targets[(u, v)] = float(edge[2]) if len(edge) > 2 else 1.0
+        
+        if not self.directed:
+            targets.update({(v, u): w for (u, v), w in list(targets.items())})
+        
+        pairs = np.array(list(targets.keys()), dtype=np.int64).reshape(-1, 2)
+        return pairs[:, 0], pairs[:, 1], np.fromiter(targets.values(), dtype=np.float64, count=len(targets))
+    
+    def update(self, insertions=(), deletions=()):
+        rows, cols, weights = self._batch_weights(insertions, deletions)
+        if len(rows) == 0:
+            return self
+        N = len(self.scores)
+        
+        current = np.asarray(self._A[rows, cols]).flatten()
+        delta = sp.csr_matrix((weights - current, (rows, cols)), shape=(N, N))
+        self._A = (self._A + delta).tocsr()
+        self._A.eliminate_zeros()
+        
+        sources = np.unique(rows)
+        old_rows = self._P[sources]
+        old_dangling = self._out_weight[sources] == 0
+        self._out_weight[sources] = np.asarray(self._A[sources].sum(axis=1)).flatten()
+        new_rows = self._row_normalize(self._A[sources], self._out_weight[sources])
+        
+        change = (new_rows - old_rows).tocoo()
+        change_matrix = sp.csr_matrix((change.data, (sources[change.row], change.col)), shape=(N, N))
+        self._P = (self._P + change_matrix).tocsr()
+        self._P.eliminate_zeros()
+        
+        x = self.scores
+        dangling_change = (self._out_weight[sources] == 0).astype(np.float64) - old_dangling
+        self.residual += self.alpha * np.bincount(change.col, change.data * x[sources[change.row]], N)
+        self._uniform += self.alpha * (dangling_change @ x[sources]) / N
+        
+        self._graph = None
+        self._hits_stale = True
+        touched = np.unique(change.col)
+        self._push(touched[np.abs(self.residual[touched]) >= self.tol])
+        
+        self.batches += 1
+        if self.check_every and self.batches % self.check_every == 0:
+            self.check()
+        
+        return self
+    
+    def check(self):
+        exact = self._exact_residual()
+        drift = np.abs(exact - self.residual - self._uniform).sum()
+        self.residual = exact
+        self._uniform = 0.0
+        
+        if drift > self.drift_tol:
+            _, X = pagerank_block(self.graph, [self.alpha], max_iter=self.max_iter, tol=self.tol, x0=self.scores)
+            self.scores = X[:, 0].copy()
+            self.residual = self._exact_residual()
+        else:
+            self._push()
+        
+        return drift
+    
+    def pagerank_scores(self):
+        return self.nodes, self.scores / self.scores.sum()
+    
+    def pagerank(self):
+        nodes, scores = self.pagerank_scores()
+        return dict(zip(nodes, scores.tolist()))
+    
+    def hits_scores(self, block_size=4, seed=0):
+        A = self._A
+        if A.nnz == 0:
+            raise nx.NetworkXError("HITS is undefined for a graph without edges")
+        if self._hits_stale:
+            A_T = A.T.tocsr() if self.directed else A
+            self._authorities = _hits_block_power(A, A_T, block_size, self.max_iter, self.tol, seed,
+                                                  x0=self._authorities)
+            self._hits_stale = False
+        
+        hubs = A @ self._authorities
+        return self.nodes, hubs / hubs.sum(), self._authorities / self._authorities.sum()
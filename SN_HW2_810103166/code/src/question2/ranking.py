@@ -1,18 +1,252 @@
+from collections import OrderedDict
+
 import networkx as nx
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.linalg import ArpackNoConvergence, LinearOperator, svds
+
+from ..graph import CSRGraph, as_csr, row_offsets
+
+
+TRANSITION_CACHE_SIZE = 4
+_TRANSITIONS = OrderedDict()
+
+
+def hits_operator(G):
+    G = as_csr(G, weight='weight')
+    A = G.to_scipy().astype(np.float64)
+    A_T = G.transpose().to_scipy().astype(np.float64) if G.is_directed() else A
+    
+    operator = LinearOperator(A.shape, matvec=lambda x: A @ x, rmatvec=lambda x: A_T @ x,
+                              matmat=lambda X: A @ X, rmatmat=lambda X: A_T @ X, dtype=np.float64)
+    return G.node_list(), A, A_T, operator
+
+
+def _hits_block_power(A, A_T, block_size, max_iter, tol, seed, x0=None):
+    N = A.shape[0]
+    rng = np.random.default_rng(seed)
+    authorities = np.full(N, 1.0 / N) if x0 is None else np.asarray(x0, dtype=np.float64) / np.sum(x0)
+    
+    Q = rng.random((N, min(block_size, N)))
+    Q[:, 0] = authorities
+    Q, _ = np.linalg.qr(Q)
+    
+    for _ in range(max_iter):
+        _, _, vt = np.linalg.svd(A @ Q, full_matrices=False)
+        updated = Q @ vt[0]
+        updated /= updated.sum() if updated.sum() != 0 else 1.0
+        
+        if np.abs(updated - authorities).sum() < N * tol:
+            return updated
+        authorities = updated
+        Q, _ = np.linalg.qr(A_T @ (A @ Q))
+    
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def hits_scores(G, max_iter=100, tol=1e-8, method='svds', top_k=None, block_size=4, seed=0):
+    nodes, A, A_T, operator = hits_operator(G)
+    N = len(nodes)
+    if N == 0:
+        return nodes, np.zeros(0), np.zeros(0)
+    if A.nnz == 0:
+        raise nx.NetworkXError("HITS is undefined for a graph without edges")
+    
+    if method == 'svds' and N > 2:
+        try:
+            _, _, vt = svds(operator, k=1, maxiter=max_iter, tol=tol)
+        except ArpackNoConvergence as exc:
+            raise nx.PowerIterationFailedConvergence(max_iter) from exc
+        authorities = vt.flatten().real
+    elif method in ('svds', 'power'):
+        authorities = _hits_block_power(A, A_T, block_size, max_iter, tol, seed)
+    else:
+        raise ValueError("method must be 'svds' or 'power'")
+    
+    hubs = A @ authorities
+    hubs /= hubs.sum()
+    authorities = authorities / authorities.sum()
+    
+    if top_k is not None:
+        top = np.argpartition(-authorities, min(top_k, N) - 1)[:top_k]
+        top = top[np.argsort(-authorities[top], kind='stable')]
+        return [nodes[i] for i in top], hubs[top], authorities[top]
+    
+    return nodes, hubs, authorities
 
 
 def calculate_hits(G, max_iter=100, tol=1e-8):
-    hubs, authorities = nx.hits(G, max_iter=max_iter, tol=tol)
-    return hubs, authorities
+    nodes, hubs, authorities = hits_scores(G, max_iter=max_iter, tol=tol)
+    return dict(zip(nodes, hubs.tolist())), dict(zip(nodes, authorities.tolist()))
+
+
+def _transition(G):
+    key = id(G)
+    if key in _TRANSITIONS and _TRANSITIONS[key][0] is G:
+        _TRANSITIONS.move_to_end(key)
+        return _TRANSITIONS[key][1]
+    
+    csr = as_csr(G, weight='weight')
+    A = csr.to_scipy().astype(np.float64)
+    out_weight = np.asarray(A.sum(axis=1)).flatten()
+    dangling = out_weight == 0
+    
+    scale = np.divide(1.0, out_weight, out=np.zeros_like(out_weight), where=~dangling)
+    P = (sp.diags(scale) @ A).tocsr()
+    transition = (csr, P, P.T.tocsr(), dangling)
+    
+    if isinstance(G, CSRGraph):
+        _TRANSITIONS[key] = (G, transition)
+        while len(_TRANSITIONS) > TRANSITION_CACHE_SIZE:
+            _TRANSITIONS.popitem(last=False)
+    
+    return transition
+
+
+def transition_matrix(G):
+    csr, _, P_T, dangling = _transition(G)
+    return csr.node_list(), P_T, dangling
+
+
+def pagerank_block(G, alpha_values, max_iter=100, tol=1e-8, x0=None):
+    nodes, P_T, dangling = transition_matrix(G)
+    N = len(nodes)
+    alphas = np.asarray(alpha_values, dtype=np.float64)
+    X = np.empty((N, len(alphas)))
+    if N == 0:
+        return nodes, X
+    
+    order = np.argsort(alphas, kind='stable')
+    start = np.full(N, 1.0 / N) if x0 is None else np.asarray(x0, dtype=np.float64) / np.sum(x0)
+    
+    seed, _ = _power_iterate(P_T, dangling, alphas[order[:1]], start[:, None], max_iter, tol)
+    X[:, order[0]] = seed[:, 0]
+    
+    rest = order[1:]
+    if len(rest):
+        block, _ = _power_iterate(P_T, dangling, alphas[rest], np.repeat(seed, len(rest), axis=1), max_iter, tol)
+        X[:, rest] = block
+    
+    return nodes, X
+
+
+def _power_iterate(P_T, dangling, alphas, X, max_iter, tol):
+    N = X.shape[0]
+    X = X.copy()
+    active = np.arange(X.shape[1])
+    
+    for iteration in range(max_iter):
+        current = X[:, active]
+        dangling_mass = current[dangling].sum(axis=0)
+        updated = alphas[active] * (P_T @ current + dangling_mass / N) + (1 - alphas[active]) / N
+        
+        errors = np.abs(updated - current).sum(axis=0)
+        X[:, active] = updated
+        active = active[errors >= N * tol]
+        if len(active) == 0:
+            return X, iteration + 1
+    
+    raise nx.PowerIterationFailedConvergence(max_iter)
 
 
 def calculate_pagerank(G, alpha=0.85, max_iter=100, tol=1e-8):
-    pagerank = nx.pagerank(G, alpha=alpha, max_iter=max_iter, tol=tol)
+    nodes, X = pagerank_block(G, [alpha], max_iter=max_iter, tol=tol)
+    pagerank = dict(zip(nodes, X[:, 0].tolist()))
     return pagerank
 
 
+def _seed_index(csr, node):
+    try:
+        index = csr.index(node)
+    except (KeyError, TypeError):
+        index = None
+    if not isinstance(index, (int, np.integer)) or not 0 <= index < csr.number_of_nodes():
+        raise nx.NetworkXError(f"Seed node {node!r} is not in the graph")
+    return int(index)
+
+
+def _seed_matrix(csr, seed_sets):
+    rows, cols, values = [], [], []
+    for i, seeds in enumerate(seed_sets):
+        weights = seeds if isinstance(seeds, dict) else dict.fromkeys(seeds, 1.0)
+        total = sum(weights.values())
+        if total == 0:
+            raise nx.NetworkXError(f"Seed weights of set {i} sum to zero")
+        for node, weight in weights.items():
+            rows.append(i)
+            cols.append(_seed_index(csr, node))
+            values.append(weight / total)
+    
+    N = csr.number_of_nodes()
+    return sp.csr_matrix((values, (rows, cols)), shape=(len(seed_sets), N))
+
+
+def _push_rows(P, pushed, rows):
+    offsets, counts = row_offsets(P.indptr, pushed.indices)
+    values = np.repeat(pushed.data, counts) * P.data[offsets]
+    return sp.csr_matrix((values, (np.repeat(rows, counts), P.indices[offsets])), shape=pushed.shape)
+
+
+def _forward_push(P, dangling, seeds, alpha, tol, max_iter):
+    seeds.sum_duplicates()
+    scores = sp.csr_matrix(seeds.shape)
+    residual = seeds.copy()
+    
+    for _ in range(max_iter):
+        degree = P.indptr[residual.indices + 1] - P.indptr[residual.indices]
+        active = residual.data >= tol * np.maximum(degree, 1)
+        if not active.any():
+            return scores, residual
+        
+        pushed = residual.copy()
+        pushed.data = np.where(active, pushed.data, 0.0)
+        pushed.eliminate_zeros()
+        residual.data[active] = 0.0
+        residual.eliminate_zeros()
+        
+        rows = np.repeat(np.arange(seeds.shape[0]), np.diff(pushed.indptr))
+        lost = alpha * np.bincount(rows, pushed.data * dangling[pushed.indices], seeds.shape[0])
+        teleport = sp.csr_matrix((seeds.data * np.repeat(lost, np.diff(seeds.indptr)), seeds.indices, seeds.indptr),
+                                 shape=seeds.shape)
+        
+        scores = scores + (1 - alpha) * pushed
+        residual = residual + alpha * _push_rows(P, pushed, rows) + teleport
+    
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def personalized_pagerank_block(G, seed_sets, alpha=0.85, tol=1e-6, max_iter=10000):
+    csr, P, _, dangling = _transition(G)
+    seeds = _seed_matrix(csr, seed_sets)
+    scores, _ = _forward_push(P, dangling, seeds, alpha, tol, max_iter)
+    return csr.node_list(), scores
+
+
+def personalized_pagerank(G, seeds, alpha=0.85, tol=1e-6, max_iter=10000):
+    csr, P, _, dangling = _transition(G)
+    scores, _ = _forward_push(P, dangling, _seed_matrix(csr, [seeds]), alpha, tol, max_iter)
+    
+    labels = scores.indices.tolist() if csr.nodes is None else [csr.nodes[i] for i in scores.indices]
+    return dict(zip(labels, scores.data.tolist()))
+
+
+def descending_ranks(scores):
+    scores = np.asarray(scores, dtype=np.float64)
+    columns = scores.reshape(len(scores), -1)
+    ranks = np.empty_like(columns)
+    positions = np.arange(1, len(scores) + 1, dtype=np.float64)
+    
+    for j in range(columns.shape[1]):
+        order = np.argsort(-columns[:, j], kind='stable')
+        ordered = columns[order, j]
+        groups = np.cumsum(np.diff(ordered, prepend=np.nan) != 0) - 1
+        average = np.bincount(groups, positions) / np.bincount(groups)
+        ranks[order, j] = average[groups]
+    
+    return ranks.reshape(scores.shape)
+
+
 def scores_to_ranks(scores_dict):
     df = pd.DataFrame(list(scores_dict.items()), columns=['node', 'score'])
     df['rank'] = df['score'].rank(ascending=False)
@@ -1,25 +1,28 @@
-import networkx as nx
 import pandas as pd
 import numpy as np
 
+from .incremental import IncrementalRanking
+from .ranking import descending_ranks, pagerank_block
+
 
 def pagerank_sensitivity_analysis(G, alpha_values=None):
     if alpha_values is None:
         alpha_values = np.linspace(0.50, 0.85, 8)
     
-    results = {}
+    x0 = None
+    if isinstance(G, IncrementalRanking):
+        x0 = G.pagerank_scores()[1]
+        G = G.graph
     
-    for alpha in alpha_values:
-        pr = nx.pagerank(G, alpha=alpha)
-        df = pd.DataFrame(list(pr.items()), columns=['node', f'score_{alpha:.2f}'])
-        df[f'rank_{alpha:.2f}'] = df[f'score_{alpha:.2f}'].rank(ascending=False)
-        results[alpha] = df
+    nodes, scores = pagerank_block(G, alpha_values, x0=x0)
+    ranks = descending_ranks(scores)
     
-    merged = results[alpha_values[0]][['node']]
-    for alpha in alpha_values:
-        merged = merged.merge(results[alpha], on='node')
+    columns = {'node': nodes}
+    for j, alpha in enumerate(alpha_values):
+        columns[f'score_{alpha:.2f}'] = scores[:, j]
+        columns[f'rank_{alpha:.2f}'] = ranks[:, j]
     
-    return merged
+    return pd.DataFrame(columns)
 
 
 def analyze_rank_trajectories(sensitivity_df, top_n=10):
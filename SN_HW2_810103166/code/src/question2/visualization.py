@@ -4,8 +4,6 @@ import os
 
 
 def plot_ranking_comparison_scatter(comparison_df, save_path='results/plots/ranking_comparison.png'):
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     fig, ax = plt.subplots(figsize=(10, 10))
     
     ax.scatter(comparison_df['pagerank_rank'], comparison_df['authority_rank'], 
@@ -23,14 +21,14 @@ def plot_ranking_comparison_scatter(comparison_df, save_path='results/plots/rank
     ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
 
 def plot_rank_trajectories(trajectories_df, save_path='results/plots/rank_trajectories.png'):
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     fig, ax = plt.subplots(figsize=(12, 8))
     
     rank_cols = [col for col in trajectories_df.columns if 'rank_' in col]
@@ -48,14 +46,14 @@ def plot_rank_trajectories(trajectories_df, save_path='results/plots/rank_trajec
     ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
 
 
 def plot_sensitivity_heatmap(sensitivity_df, top_n=20, save_path='results/plots/sensitivity_heatmap.png'):
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    
     rank_cols = [col for col in sensitivity_df.columns if 'rank_' in col]
     
     avg_ranks = sensitivity_df[rank_cols].mean(axis=1)
@@ -79,6 +77,8 @@ def plot_sensitivity_heatmap(sensitivity_df, top_n=20, save_path='results/plots/
     
     plt.colorbar(im, ax=ax, label='Rank')
     plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if save_path:
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
     
     return fig
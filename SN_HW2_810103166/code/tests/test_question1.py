@@ -1,7 +1,18 @@
+import os
 import pytest
 import networkx as nx
+import numpy as np
 from src.question1.centrality import *
 from src.question1.analysis import *
+from src.question1.layout import cached_layout
+from src.question1.bottlenecks import approximate_betweenness, brandes_scores, rank_gap_analysis, calculate_betweenness_centrality, calculate_edge_betweenness
+from src.question1.traversal import TRAVERSAL_CACHE, calculate_eccentricity
+from src.question1.efficiency import extract_ego_network, identify_efficient_monitors
+from src.question1.bonacich import analyze_power_regimes, calculate_bonacich_power
+from src.graph import CSRGraph, as_csr
+from src.cache import ArrayCache
+from src.export import export_figures
+from src.question1.visualization import plot_efficiency_scatter
 
 
 def test_normalized_degree():
@@ -36,3 +47,145 @@ def test_gap_analysis():
     assert len(df) == G.number_of_nodes()
     assert 'degree_rank' in df.columns
     assert 'eig_rank' in df.columns
+
+
+def test_cached_layout():
+    G = nx.karate_club_graph()
+    cache = ArrayCache()
+    
+    pos = cached_layout(G, k=2, cache=cache)
+    again = cached_layout(G, k=2, cache=cache)
+    
+    assert set(pos) == set(G.nodes())
+    assert cache.hits == 1
+    assert all((pos[n] == again[n]).all() for n in G)
+    
+    small = ArrayCache(max_entries=1)
+    cached_layout(G, k=2, cache=small)
+    cached_layout(G, k=3, cache=small)
+    cached_layout(G, k=2, cache=small)
+    assert small.misses == 3 and len(small._memory) == 1
+
+
+def test_csr_graph_centralities_match_networkx():
+    G = nx.karate_club_graph()
+    C = as_csr(G)
+    
+    assert isinstance(C, CSRGraph)
+    assert C.number_of_edges() == G.number_of_edges()
+    assert calculate_normalized_degree(C) == calculate_normalized_degree(G)
+    
+    eig_nx = calculate_eigenvector_centrality(G)
+    eig_csr = calculate_eigenvector_centrality(C)
+    assert all(abs(eig_nx[n] - eig_csr[n]) < 1e-4 for n in G)
+    
+    power_nx = calculate_bonacich_power(G, beta=0.01)
+    power_csr = calculate_bonacich_power(as_csr(G, weight='weight'), beta=0.01)
+    assert all(abs(power_nx[n] - power_csr[n]) < 1e-9 for n in G)
+    
+    ego = extract_ego_network(C, 0)
+    assert set(ego) == set(nx.ego_graph(G, 0)) and nx.utils.edges_equal(ego.edges(), nx.ego_graph(G, 0).edges())
+    assert ego.nodes[0]['club'] == G.nodes[0]['club']
+    assert identify_efficient_monitors(C, degree_threshold=0).equals(identify_efficient_monitors(G, degree_threshold=0))
+
+
+def test_bonacich_power_matches_dense_solution():
+    G = nx.karate_club_graph()
+    A = nx.to_numpy_array(G)
+    expected = np.linalg.solve(np.eye(len(A)) - 0.03 * A, np.ones(len(A)))
+    
+    power = calculate_bonacich_power(G, beta=0.03)
+    assert np.allclose([power[n] for n in G], expected)
+    
+    df = analyze_power_regimes(G, beta_values=[0, 0.01, 0.03, -0.03])
+    assert np.allclose(df['power_0.03'], expected)
+    
+    with pytest.raises(ValueError):
+        calculate_bonacich_power(G, beta=0.05)
+
+
+def test_brandes_betweenness_matches_networkx():
+    G = nx.karate_club_graph()
+    assert calculate_betweenness_centrality(G) == pytest.approx(nx.betweenness_centrality(G), abs=1e-12)
+    assert calculate_edge_betweenness(G) == pytest.approx(nx.edge_betweenness_centrality(G), abs=1e-12)
+    
+    D = nx.gnp_random_graph(60, 0.05, directed=True, seed=2)
+    expected = nx.betweenness_centrality(D, normalized=False)
+    assert calculate_betweenness_centrality(D, normalized=False) == pytest.approx(expected, abs=1e-9)
+    
+    P = nx.path_graph(200)
+    assert calculate_betweenness_centrality(P) == pytest.approx(nx.betweenness_centrality(P), abs=1e-12)
+    R = nx.cycle_graph(101)
+    assert calculate_edge_betweenness(R) == pytest.approx(nx.edge_betweenness_centrality(R), abs=1e-12)
+    
+    progress = []
+    _, serial, serial_edges = brandes_scores(D, block_size=4, edges=True, progress=lambda done, total: progress.append(total))
+    assert progress == [15] * 15
+    
+    progress = []
+    _, sharded, sharded_edges = brandes_scores(D, workers=2, block_size=4, edges=True,
+                                               progress=lambda done, total: progress.append(total))
+    assert np.allclose(serial, sharded) and np.allclose(serial_edges, sharded_edges)
+    assert progress == [2, 2]
+
+
+def test_approximate_betweenness_bounds_exact_values():
+    G = nx.barabasi_albert_graph(300, 2, seed=4)
+    exact = nx.betweenness_centrality(G)
+    
+    estimates = approximate_betweenness(G, top_k=3, epsilon=0.03, delta=0.1, seed=0)
+    values = estimates['node'].map(exact)
+    assert ((values >= estimates['lower'] - 1e-9) & (values <= estimates['upper'] + 1e-9)).mean() > 0.99
+    assert estimates['node'].iloc[0] == max(exact, key=exact.get)
+    
+    gaps = rank_gap_analysis(G, top_n=3, method='approximate', epsilon=0.03, seed=0)
+    assert list(gaps['bet_rank']) == [1.0, 2.0, 3.0]
+    assert list(gaps['closeness']) == pytest.approx([nx.closeness_centrality(G, u=n) for n in gaps['node']])
+    assert list(gaps['degree']) == [G.degree(n) for n in gaps['node']]
+    assert 'close_rank' not in gaps and {'lower', 'upper'} <= set(gaps)
+    
+    D = nx.gnp_random_graph(80, 0.05, directed=True, seed=3)
+    gaps = rank_gap_analysis(D, top_n=4, method='approximate', epsilon=0.05, seed=0)
+    assert list(gaps['closeness']) == pytest.approx([nx.closeness_centrality(D, u=n) for n in gaps['node']])
+
+
+def test_approximate_betweenness_is_unbiased_on_small_graphs():
+    estimates = approximate_betweenness(nx.star_graph(19), top_k=1, epsilon=0.005, seed=1).set_index('node')
+    assert estimates.loc[0, 'betweenness'] == pytest.approx(1.0, abs=0.01)
+
+
+def test_fused_traversal_shares_one_pass():
+    G = nx.disjoint_union(nx.karate_club_graph(), nx.path_graph(4))
+    assert calculate_closeness_centrality(G) == pytest.approx(nx.closeness_centrality(G), abs=1e-12)
+    
+    misses = TRAVERSAL_CACHE.misses
+    rank_gap_analysis(G, top_n=5)
+    identify_efficient_monitors(G)
+    assert TRAVERSAL_CACHE.misses == misses
+    
+    K = nx.karate_club_graph()
+    assert calculate_eccentricity(K) == nx.eccentricity(K)
+    D = nx.gnp_random_graph(50, 0.06, directed=True, seed=8)
+    assert calculate_closeness_centrality(D) == pytest.approx(nx.closeness_centrality(D), abs=1e-12)
+
+
+def test_traversal_cache_is_bounded():
+    cache = ArrayCache(max_entries=2)
+    for size in (5, 6, 7):
+        cache.get_or_compute(ArrayCache.key(nx.path_graph(size)), lambda: np.zeros(size))
+    cache.get_or_compute(ArrayCache.key(nx.path_graph(5)), lambda: np.zeros(5))
+    
+    assert cache.misses == 4 and len(cache._memory) == 2
+
+
+def test_export_figures_uses_requested_dpi(tmp_path):
+    import matplotlib.pyplot as plt
+    
+    df = identify_efficient_monitors(nx.karate_club_graph(), degree_threshold=0)
+    specs = [{'name': 'efficiency', 'plot': plot_efficiency_scatter, 'args': (df,)}]
+    low = export_figures(specs, output_dir=str(tmp_path / 'low'), formats=('png', 'pdf'), workers=1, dpi=50)
+    high = export_figures(specs, output_dir=str(tmp_path / 'high'), formats=('png', 'pdf'), workers=1, dpi=100)
+    
+    assert all(os.path.exists(path) for path in low['efficiency']['paths'])
+    assert abs(plt.imread(high['efficiency']['paths'][0]).shape[1] - 2 * plt.imread(low['efficiency']['paths'][0]).shape[1]) <= 4
+    assert export_figures(specs, output_dir=str(tmp_path / 'low'), formats=('png', 'pdf'), workers=1, dpi=50)['efficiency']['skipped']
@@ -0,0 +1,109 @@
+import pytest
+import networkx as nx
+import numpy as np
+from src.question2.ranking import calculate_hits, calculate_pagerank, descending_ranks, hits_scores
+from src.question2.ranking import personalized_pagerank, personalized_pagerank_block
+from src.question2.analysis import ranking_comparison
+from src.question2.incremental import IncrementalRanking
+from src.question2.stability import pagerank_sensitivity_analysis
+from src.graph import as_csr
+
+
+def test_block_pagerank_matches_networkx():
+    G = nx.gnp_random_graph(80, 0.05, directed=True, seed=3)
+    alphas = [0.85, 0.5, 0.7]
+    frame = pagerank_sensitivity_analysis(G, alphas)
+    
+    for alpha in alphas:
+        expected = nx.pagerank(G, alpha=alpha, tol=1e-12)
+        assert np.allclose(frame[f'score_{alpha:.2f}'], [expected[n] for n in frame['node']], atol=1e-6)
+    
+    pagerank = calculate_pagerank(as_csr(G))
+    assert pagerank == pytest.approx(nx.pagerank(G), abs=1e-5)
+    assert descending_ranks([0.3, 0.1, 0.3, 0.2]).tolist() == [1.5, 4.0, 1.5, 3.0]
+
+
+def test_sparse_hits_matches_networkx():
+    G = nx.gnp_random_graph(120, 0.04, directed=True, seed=5)
+    hubs, authorities = nx.hits(G)
+    
+    assert calculate_hits(G)[1] == pytest.approx(authorities, abs=1e-8)
+    nodes, power_hubs, power_authorities = hits_scores(as_csr(G), method='power')
+    assert np.allclose(power_hubs, [hubs[n] for n in nodes], atol=1e-6)
+    
+    top, _, top_authorities = hits_scores(G, top_k=5)
+    assert top == sorted(authorities, key=authorities.get, reverse=True)[:5]
+    
+    pagerank = calculate_pagerank(G)
+    comparison = ranking_comparison((nodes, power_authorities), pagerank)
+    assert len(comparison) == G.number_of_nodes()
+    
+    for u, v in G.edges():
+        G[u][v]['weight'] = 1 + (u * v) % 5
+    assert calculate_hits(G)[1] == pytest.approx(nx.hits(G)[1], abs=1e-8)
+    
+    edgeless = nx.empty_graph(4, create_using=nx.DiGraph)
+    with pytest.raises(nx.NetworkXError):
+        hits_scores(edgeless)
+    with pytest.raises(nx.NetworkXError):
+        IncrementalRanking(edgeless).hits_scores()
+
+
+def test_personalized_pagerank_push():
+    G = nx.gnp_random_graph(150, 0.03, directed=True, seed=7)
+    expected = nx.pagerank(G, personalization={0: 1, 4: 1}, tol=1e-12)
+    
+    scores = personalized_pagerank(as_csr(G), [0, 4], tol=1e-9)
+    assert all(abs(expected[n] - scores.get(n, 0.0)) < 1e-6 for n in G)
+    
+    nodes, block = personalized_pagerank_block(G, [[0, 4], {2: 1.0}], tol=1e-9)
+    assert block.shape == (2, len(nodes))
+    assert np.allclose(block[0].toarray().ravel(), [expected[n] for n in nodes], atol=1e-6)
+    
+    labelled = nx.relabel_nodes(G, str)
+    for graph, seeds in ((G, [0, 999]), (labelled, ['0', 'missing']), (G, {0: 0.0, 4: 0.0})):
+        with pytest.raises(nx.NetworkXError):
+            personalized_pagerank(as_csr(graph), seeds)
+
+
+def test_incremental_ranking_tracks_edge_updates():
+    G = nx.gnp_random_graph(150, 0.04, directed=True, seed=11)
+    ranker = IncrementalRanking(G, tol=1e-10, check_every=2)
+    
+    removed = list(G.edges())[:15]
+    added = [(0, 1), (2, 3), (5, 140), (140, 5)]
+    for batch in (added[:2], added[2:]):
+        G.add_edges_from(batch)
+        ranker.update(insertions=batch)
+    G.remove_edges_from(removed)
+    ranker.update(deletions=removed)
+    
+    expected = nx.pagerank(G, tol=1e-12)
+    assert ranker.pagerank() == pytest.approx(expected, abs=1e-7)
+    assert ranker.check() < 1e-6
+    
+    authorities = nx.hits(G)[1]
+    nodes, _, scores = ranker.hits_scores()
+    assert np.allclose(scores, [authorities[n] for n in nodes], atol=1e-6)
+    
+    assert len(ranking_comparison(ranker, ranker)) == G.number_of_nodes()
+    assert 'rank_0.85' in pagerank_sensitivity_analysis(ranker, [0.85]).columns
+    
+    with pytest.raises(nx.NetworkXError):
+        ranker.update(insertions=[(3, 3)])
+
+
+def test_incremental_ranking_folds_dangling_mass():
+    G = nx.gnp_random_graph(300, 0.008, directed=True, seed=2)
+    ranker = IncrementalRanking(G, tol=1e-11, check_every=0)
+    
+    sinks = [n for n in G if G.out_degree(n) == 0][:6]
+    batch = [(sinks[0], sinks[1]), (sinks[2], sinks[3])]
+    G.add_edges_from(batch)
+    ranker.update(insertions=batch)
+    removed = [next(iter(G.out_edges(n))) for n in G if G.out_degree(n) == 1][:5]
+    G.remove_edges_from(removed)
+    ranker.update(deletions=removed)
+    
+    assert ranker.pagerank() == pytest.approx(nx.pagerank(G, tol=1e-13), abs=1e-8)
+    assert ranker.check() < 1e-6
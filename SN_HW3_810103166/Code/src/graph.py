@@ -0,0 +1 @@
+from sn_common.graph import (CSRGraph, as_csr, as_networkx, index_dtype, load_signed_csr)
@@ -2,6 +2,8 @@ import networkx as nx
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from .layout import cached_layout
+
 
 def load_signed_network(filepath):
     df = pd.read_csv(filepath)
@@ -35,8 +37,8 @@ def detect_clusters_weakly_balanced(G, edge_signs):
     return clusters, node_to_cluster
 
 
-def visualize_clusters(G, edge_signs, node_to_cluster, filename, save_path=None):
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+def visualize_clusters(G, edge_signs, node_to_cluster, filename, save_path=None, show=True):
+    pos = cached_layout(G, k=2, iterations=50, seed=42)
     
     plt.figure(figsize=(12, 8))
     
@@ -62,10 +64,12 @@ def visualize_clusters(G, edge_signs, node_to_cluster, filename, save_path=None)
     plt.title(f'Weakly Balanced Network - {filename}')
     plt.axis('off')
     
+    plt.tight_layout()
     if save_path:
         plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+    plt.close()
 
 
 def detect_clusters(filepath, visualize=True):
@@ -1,12 +1,27 @@
 import networkx as nx
 
+from ..graph import CSRGraph
+
 
 def compute_degree_centrality(G):
     """Compute degree centrality for all nodes"""
+    if isinstance(G, CSRGraph):
+        scale = 1 / (G.number_of_nodes() - 1) if G.number_of_nodes() > 1 else 1
+        return dict(zip(G.node_list(), (G.degree() * scale).tolist()))
+    
     centrality = nx.degree_centrality(G)
     return centrality
 
 
+def _node_view(G, node):
+    """Degree, attributes and neighbours of a node for either backend"""
+    if isinstance(G, CSRGraph):
+        i = G.index(node)
+        nodes = G.node_list()
+        return int(G.degree()[i]), G.node_attributes(node), [nodes[j] for j in G.neighbors(i)]
+    return G.degree(node), G.nodes[node], list(G.neighbors(node))
+
+
 def get_top_central_students(G, top_n=5):
     """Get top N most central students"""
     centrality = compute_degree_centrality(G)
@@ -15,13 +30,14 @@ def get_top_central_students(G, top_n=5):
     
     top_students = []
     for node, cent in sorted_nodes[:top_n]:
+        degree, data, _ = _node_view(G, node)
         top_students.append({
             'student_id': node,
             'centrality': cent,
-            'degree': G.degree(node),
-            'smokes': G.nodes[node].get('smokes', 0),
-            'gender': G.nodes[node].get('gender', -1),
-            'class': G.nodes[node].get('class_number', -1)
+            'degree': degree,
+            'smokes': data.get('smokes', 0),
+            'gender': data.get('gender', -1),
+            'class': data.get('class_number', -1)
         })
     
     return top_students
@@ -33,9 +49,9 @@ def analyze_central_students_role(G, top_students):
     
     for student in top_students:
         node = student['student_id']
-        neighbors = list(G.neighbors(node))
+        _, _, neighbors = _node_view(G, node)
         
-        smoker_neighbors = sum(1 for n in neighbors if G.nodes[n].get('smokes', 0) == 1)
+        smoker_neighbors = sum(1 for n in neighbors if _node_view(G, n)[1].get('smokes', 0) == 1)
         
         analysis.append({
             'student_id': node,
@@ -1,19 +1,17 @@
 import networkx as nx
+import numpy as np
 import pandas as pd
 
+from ..graph import CSRGraph
 
-def load_network(day, data_path='../Networks/Part_B'):
+
+def load_network(day, data_path='../Networks/Part_B', backend='networkx'):
     """Load network and attributes for a specific day"""
     
     # Load connections
     conn_file = f"{data_path}/connections_day_{day}.csv"
     edges_df = pd.read_csv(conn_file)
     
-    # Create graph
-    G = nx.Graph()
-    for _, row in edges_df.iterrows():
-        G.add_edge(int(row['node_i']), int(row['node_j']))
-    
     # Load properties
     prop_file = f"{data_path}/properties_day_{day}.csv"
     props_df = pd.read_csv(prop_file)
@@ -21,6 +19,14 @@ def load_network(day, data_path='../Networks/Part_B'):
     # Convert gender to binary
     props_df['gender'] = props_df['gender'].apply(lambda x: 1 if x == 'boy' else 0)
     
+    if backend == 'csr':
+        return _load_csr(edges_df, props_df), props_df
+    
+    # Create graph
+    G = nx.Graph()
+    for _, row in edges_df.iterrows():
+        G.add_edge(int(row['node_i']), int(row['node_j']))
+    
     # Add node attributes
     for _, row in props_df.iterrows():
         node_id = int(row['id'])
@@ -34,6 +40,17 @@ def load_network(day, data_path='../Networks/Part_B'):
     return G, props_df
 
 
+def _load_csr(edges_df, props_df):
+    """Build a CSRGraph over the union of edge endpoints and property ids"""
+    endpoints = edges_df[['node_i', 'node_j']].to_numpy(dtype=int)
+    nodes = np.unique(np.concatenate([endpoints.ravel(), props_df['id'].to_numpy(dtype=int)]))
+    edges = np.searchsorted(nodes, endpoints)
+    
+    props = props_df.drop_duplicates('id').set_index('id').reindex(nodes)
+    node_data = {col: props[col].to_numpy() for col in props.columns}
+    return CSRGraph.from_edges(len(nodes), edges, nodes=nodes.tolist(), node_data=node_data)
+
+
 def load_all_networks(data_path='../Networks/Part_B'):
     """Load all 4 time steps"""
     days = [1, 30, 60, 90]
@@ -50,9 +67,13 @@ def load_all_networks(data_path='../Networks/Part_B'):
 
 def get_smokers(G):
     """Get list of smokers from network"""
+    if isinstance(G, CSRGraph):
+        return [n for n in G.node_list() if G.node_attributes(n).get('smokes', 0) == 1]
     return [n for n, d in G.nodes(data=True) if d.get('smokes', 0) == 1]
 
 
 def get_non_smokers(G):
     """Get list of non-smokers"""
+    if isinstance(G, CSRGraph):
+        return [n for n in G.node_list() if G.node_attributes(n).get('smokes', 0) == 0]
     return [n for n, d in G.nodes(data=True) if d.get('smokes', 0) == 0]
@@ -0,0 +1,16 @@
+import pandas as pd
+from src.graph import load_signed_csr
+
+
+def test_load_signed_csr_keeps_labels_and_signs(tmp_path):
+    path = tmp_path / 'signed.csv'
+    pd.DataFrame({'u': [10, 10, 30], 'v': [20, 30, 20], 'sign': [1, -1, -1]}).to_csv(path, index=False)
+    
+    G = load_signed_csr(str(path))
+    assert G.nodes == [10, 20, 30]
+    assert G.number_of_edges() == 3
+    assert G.to_networkx()[30][10]['sign'] == -1
+    
+    D = load_signed_csr(str(path), directed=True)
+    assert D.is_directed() and D.number_of_edges() == 3
+    assert D.to_networkx()[10][30]['sign'] == -1
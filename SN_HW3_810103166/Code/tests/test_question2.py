@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+import pandas as pd
+from src.graph import CSRGraph
+from src.question2.network_loader import load_network, get_smokers, get_non_smokers
+from src.question2.centrality import (
+    compute_degree_centrality,
+    get_top_central_students,
+    analyze_central_students_role
+)
+
+
+@pytest.fixture
+def day_path(tmp_path):
+    rng = np.random.default_rng(0)
+    edges = {tuple(sorted(pair)) for pair in rng.integers(1, 41, size=(120, 2)).tolist() if pair[0] != pair[1]}
+    pd.DataFrame(sorted(edges), columns=['node_i', 'node_j']).to_csv(tmp_path / 'connections_day_1.csv', index=False)
+    pd.DataFrame({
+        'id': range(1, 42),
+        'gender': rng.choice(['boy', 'girl'], 41),
+        'smokes': rng.integers(0, 2, 41),
+        'class_number': rng.integers(1, 5, 41)
+    }).to_csv(tmp_path / 'properties_day_1.csv', index=False)
+    return str(tmp_path)
+
+
+def test_csr_loader_keeps_node_attributes(day_path):
+    G, props = load_network(1, day_path)
+    C, _ = load_network(1, day_path, backend='csr')
+    
+    assert isinstance(C, CSRGraph)
+    assert C.number_of_nodes() == G.number_of_nodes() == 41
+    assert C.number_of_edges() == G.number_of_edges()
+    assert C.node_data['smokes'].dtype.kind == 'i'
+    assert C.node_attributes(41) == {key: value for key, value in G.nodes[41].items()}
+    assert sorted(get_smokers(C)) == sorted(get_smokers(G))
+    assert sorted(get_non_smokers(C)) == sorted(get_non_smokers(G))
+
+
+def test_central_students_match_across_backends(day_path):
+    G, _ = load_network(1, day_path)
+    C, _ = load_network(1, day_path, backend='csr')
+    
+    assert compute_degree_centrality(C) == pytest.approx(compute_degree_centrality(G))
+    
+    by_id = lambda rows: sorted(rows, key=lambda row: row['student_id'])
+    top_nx = get_top_central_students(G, top_n=41)
+    top_csr = get_top_central_students(C, top_n=41)
+    assert by_id(top_csr) == by_id(top_nx)
+    assert by_id(analyze_central_students_role(C, top_csr)) == by_id(analyze_central_students_role(G, top_nx))
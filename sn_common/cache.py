@@ -0,0 +1,49 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from .graph import graph_fingerprint
+
+
+class ArrayCache:
+    def __init__(self, cache_dir=None, max_entries=32):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+    
+    @staticmethod
+    def key(G, **params):
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256((graph_fingerprint(G) + payload).encode()).hexdigest()
+    
+    def get_or_compute(self, key, compute):
+        path = os.path.join(self.cache_dir, f'{key}.npy') if self.cache_dir is not None else None
+        
+        if key in self._memory:
+            self.hits += 1
+        elif path is not None and os.path.exists(path):
+            self.hits += 1
+            self._remember(key, np.load(path))
+        else:
+            self.misses += 1
+            self._remember(key, compute())
+            if path is not None:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(path, self._memory[key])
+        
+        self._memory.move_to_end(key)
+        return self._memory[key]
+    
+    def clear(self):
+        self._memory.clear()
+    
+    def _remember(self, key, array):
+        self._memory[key] = array
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
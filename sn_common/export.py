@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import matplotlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+from .graph import graph_fingerprint
+
+
+FORMATS = ('png', 'svg', 'pdf')
+MANIFEST_NAME = '.figures.json'
+
+
+def _init_worker():
+    matplotlib.use('Agg')
+
+
+def _canonical(value, digest):
+    digest.update(type(value).__name__.encode())
+    if isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            _canonical(key, digest)
+            _canonical(value[key], digest)
+    elif isinstance(value, (list, tuple)):
+        digest.update(str(len(value)).encode())
+        for item in value:
+            _canonical(item, digest)
+    elif isinstance(value, np.ndarray):
+        digest.update(f'{value.dtype.str}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).tobytes() if value.dtype != object else repr(value.tolist()).encode())
+    elif hasattr(value, 'to_dict') and hasattr(value, 'index'):
+        _canonical(value.to_dict(orient='split') if hasattr(value, 'columns') else value.to_dict(), digest)
+    elif hasattr(value, 'number_of_nodes'):
+        digest.update(graph_fingerprint(value).encode())
+    else:
+        digest.update(repr(value).encode())
+
+
+def spec_hash(spec, formats, dpi):
+    plot = spec['plot']
+    digest = hashlib.sha256()
+    _canonical((plot.__module__, plot.__qualname__, spec.get('args', ()), spec.get('kwargs', {}),
+                tuple(formats), dpi), digest)
+    return digest.hexdigest()
+
+
+def _render(spec, paths, dpi):
+    import matplotlib.pyplot as plt
+    
+    fig = spec['plot'](*spec.get('args', ()), save_path=None, **spec.get('kwargs', {}))
+    try:
+        for path in paths:
+            fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    
+    return paths
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def export_figures(specs, output_dir='results/plots', formats=('png',), workers=None, dpi=300, force=False):
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    
+    results = {}
+    pending = []
+    for spec in specs:
+        name = spec['name']
+        paths = [os.path.join(output_dir, f'{name}.{fmt}') for fmt in formats]
+        digest = spec_hash(spec, formats, dpi)
+        
+        if not force and manifest.get(name) == digest and all(os.path.exists(p) for p in paths):
+            results[name] = {'paths': paths, 'skipped': True}
+        else:
+            pending.append((spec, paths, digest))
+    
+    if workers == 1 or len(pending) <= 1:
+        rendered = [_render(spec, paths, dpi) for spec, paths, _ in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            rendered = list(executor.map(_render, *zip(*[(spec, paths, dpi) for spec, paths, _ in pending])))
+    
+    for (spec, _, digest), paths in zip(pending, rendered):
+        manifest[spec['name']] = digest
+        results[spec['name']] = {'paths': paths, 'skipped': False}
+    
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    
+    return results
@@ -0,0 +1,355 @@
+import hashlib
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse import csgraph
+
+
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def index_dtype(n):
+    return np.int32 if n <= np.iinfo(np.int32).max else np.int64
+
+
+def _node_column(values):
+    present = [v for v in values if v is not None]
+    if all(isinstance(v, (bool, int, float, np.number)) for v in present):
+        if len(present) == len(values):
+            return np.asarray(values)
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _present(value):
+    return value is not None and value == value
+
+
+class CSRGraph:
+    __slots__ = ('indptr', 'indices', 'weights', 'signs', 'nodes', 'node_data', 'directed',
+                 '_index', '_degree', '_transpose', '_undirected', '_matrix')
+    
+    def __init__(self, indptr, indices, weights=None, signs=None, nodes=None, directed=False, node_data=None):
+        self.indptr = np.asarray(indptr, dtype=index_dtype(len(indices)))
+        self.indices = np.asarray(indices, dtype=index_dtype(len(indptr) - 1))
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+        self.signs = None if signs is None else np.asarray(signs, dtype=np.int8)
+        self.nodes = None if nodes is None else list(nodes)
+        self.node_data = {key: np.asarray(values) for key, values in (node_data or {}).items()}
+        self.directed = directed
+        self._index = None
+        self._degree = None
+        self._transpose = None
+        self._undirected = None
+        self._matrix = None
+    
+    @classmethod
+    def from_edges(cls, N, edges, weights=None, signs=None, nodes=None, directed=False, node_data=None):
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        loops = edges[:, 0] != edges[:, 1]
+        edges = edges[loops]
+        attributes = [np.asarray(a)[loops] for a in (weights, signs) if a is not None]
+        
+        u, v = edges[:, 0], edges[:, 1]
+        if not directed:
+            u, v = np.concatenate([u, v]), np.concatenate([v, u])
+            attributes = [np.concatenate([a, a]) for a in attributes]
+        
+        keys = u * N + v
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        first = np.diff(keys, prepend=-1) != 0
+        keys = keys[first]
+        attributes = iter([a[order][first] for a in attributes])
+        u, v = np.divmod(keys, N)
+        
+        indptr = np.zeros(N + 1, dtype=np.int64)
+        np.cumsum(np.bincount(u, minlength=N), out=indptr[1:])
+        
+        return cls(indptr, v,
+                   weights=next(attributes) if weights is not None else None,
+                   signs=next(attributes) if signs is not None else None,
+                   nodes=nodes, directed=directed, node_data=node_data)
+    
+    @classmethod
+    def from_networkx(cls, G, weight=None, sign=None):
+        nodes = list(G.nodes())
+        mapping = {node: i for i, node in enumerate(nodes)}
+        edges = np.array([(mapping[u], mapping[v]) for u, v in G.edges()], dtype=np.int64)
+        
+        weights = signs = None
+        if weight is not None:
+            weights = np.array([d.get(weight, 1.0) for _, _, d in G.edges(data=True)], dtype=np.float64)
+        if sign is not None:
+            signs = np.array([d.get(sign, 1) for _, _, d in G.edges(data=True)], dtype=np.int8)
+        
+        keys = {key for _, d in G.nodes(data=True) for key in d}
+        node_data = {key: _node_column([d.get(key) for _, d in G.nodes(data=True)]) for key in sorted(keys)}
+        
+        identity = nodes == list(range(len(nodes)))
+        return cls.from_edges(len(nodes), edges, weights=weights, signs=signs,
+                              nodes=None if identity else nodes, directed=G.is_directed(),
+                              node_data=node_data)
+    
+    def node_list(self):
+        return list(range(self.number_of_nodes())) if self.nodes is None else self.nodes
+    
+    def index(self, node):
+        if self.nodes is None:
+            return node
+        if self._index is None:
+            self._index = {n: i for i, n in enumerate(self.nodes)}
+        return self._index[node]
+    
+    def node_attributes(self, node):
+        i = self.index(node)
+        data = {key: values[i:i + 1].tolist()[0] for key, values in self.node_data.items()}
+        return {key: value for key, value in data.items() if _present(value)}
+    
+    def number_of_nodes(self):
+        return len(self.indptr) - 1
+    
+    def number_of_edges(self):
+        return len(self.indices) if self.directed else len(self.indices) // 2
+    
+    def is_directed(self):
+        return self.directed
+    
+    def degree(self):
+        if self._degree is None:
+            self._degree = np.diff(self.indptr)
+        return self._degree
+    
+    def neighbors(self, u):
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+    
+    def edges(self):
+        u = np.repeat(np.arange(self.number_of_nodes(), dtype=self.indices.dtype), self.degree())
+        if self.directed:
+            return np.column_stack([u, self.indices])
+        mask = u < self.indices
+        return np.column_stack([u[mask], self.indices[mask]])
+    
+    def transpose(self):
+        if not self.directed:
+            return self
+        if self._transpose is None:
+            N = self.number_of_nodes()
+            rows = np.repeat(np.arange(N, dtype=self.indices.dtype), self.degree())
+            order = np.lexsort((rows, self.indices))
+            indptr = np.zeros(N + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=N), out=indptr[1:])
+            self._transpose = CSRGraph(indptr, rows[order],
+                                       weights=None if self.weights is None else self.weights[order],
+                                       signs=None if self.signs is None else self.signs[order],
+                                       nodes=self.nodes, directed=True, node_data=self.node_data)
+        return self._transpose
+    
+    def to_undirected(self):
+        if not self.directed:
+            return self
+        if self._undirected is None:
+            u = np.repeat(np.arange(self.number_of_nodes(), dtype=self.indices.dtype), self.degree())
+            self._undirected = CSRGraph.from_edges(self.number_of_nodes(), np.column_stack([u, self.indices]),
+                                                   weights=self.weights, signs=self.signs,
+                                                   nodes=self.nodes, node_data=self.node_data)
+        return self._undirected
+    
+    def to_scipy(self):
+        if self._matrix is None:
+            N = self.number_of_nodes()
+            data = np.ones(len(self.indices), dtype=np.int8) if self.weights is None else self.weights
+            self._matrix = sp.csr_matrix((data, self.indices, self.indptr), shape=(N, N))
+        return self._matrix
+    
+    def connected_components(self):
+        return csgraph.connected_components(self.to_scipy(), directed=False)
+    
+    def distances(self, sources):
+        return csgraph.shortest_path(self.to_scipy(), method='D', directed=False,
+                                     unweighted=True, indices=sources)
+    
+    def is_connected(self):
+        if self.number_of_nodes() == 0:
+            return False
+        return self.connected_components()[0] == 1
+    
+    def to_networkx(self):
+        G = nx.DiGraph() if self.directed else nx.Graph()
+        nodes = self.node_list()
+        node_data = {key: values.tolist() for key, values in self.node_data.items()}
+        G.add_nodes_from((node, {key: values[i] for key, values in node_data.items() if _present(values[i])})
+                         for i, node in enumerate(nodes))
+        
+        edges = self.edges().tolist()
+        if self.nodes is not None:
+            edges = [(nodes[a], nodes[b]) for a, b in edges]
+        
+        attributes = {key: values for key, values in (('weight', self.weights), ('sign', self.signs))
+                      if values is not None}
+        if attributes:
+            u = np.repeat(np.arange(self.number_of_nodes()), self.degree())
+            mask = slice(None) if self.directed else u < self.indices
+            attributes = {key: values[mask].tolist() for key, values in attributes.items()}
+            edges = [(a, b, {key: values[i] for key, values in attributes.items()})
+                     for i, (a, b) in enumerate(edges)]
+        
+        G.add_edges_from(edges)
+        return G
+
+
+def as_csr(G, weight=None, sign=None):
+    if isinstance(G, CSRGraph):
+        return G
+    return CSRGraph.from_networkx(G, weight=weight, sign=sign)
+
+
+def as_networkx(G):
+    if isinstance(G, CSRGraph):
+        return G.to_networkx()
+    return G
+
+
+
+def node_degrees(G):
+    if not isinstance(G, CSRGraph):
+        return dict(G.degree())
+    degree = G.degree() + G.transpose().degree() if G.is_directed() else G.degree()
+    return dict(zip(G.node_list(), degree.tolist()))
+
+
+def ego_graph(G, node):
+    if not isinstance(G, CSRGraph):
+        return nx.ego_graph(G, node)
+    center = G.index(node)
+    members = np.union1d([center], G.neighbors(center))
+    
+    edges = G.edges()
+    inside = np.isin(edges[:, 0], members) & np.isin(edges[:, 1], members)
+    nodes = G.node_list()
+    ego = nx.DiGraph() if G.is_directed() else nx.Graph()
+    ego.add_nodes_from((nodes[i], G.node_attributes(nodes[i])) for i in members.tolist())
+    ego.add_edges_from((nodes[u], nodes[v]) for u, v in edges[inside].tolist())
+    return ego
+
+
+def load_signed_csr(filepath, directed=False):
+    import pandas as pd
+    
+    df = pd.read_csv(filepath)
+    nodes, codes = np.unique(np.concatenate([df['u'].to_numpy(), df['v'].to_numpy()]), return_inverse=True)
+    edges = codes.reshape(2, -1).T
+    
+    return CSRGraph.from_edges(len(nodes), edges, signs=df['sign'].to_numpy(),
+                               nodes=nodes.tolist(), directed=directed)
+
+
+def graph_fingerprint(G):
+    digest = hashlib.sha256()
+    if isinstance(G, CSRGraph):
+        digest.update(G.indptr.astype(np.int64).tobytes())
+        digest.update(G.indices.astype(np.int64).tobytes())
+        digest.update(repr(G.node_list()).encode())
+    else:
+        digest.update(repr(list(G.nodes())).encode())
+        digest.update(repr(list(G.edges())).encode())
+    return digest.hexdigest()
+
+def lattice_csr(shape, reach=1, periodic=True):
+    shape = tuple(int(s) for s in shape)
+    N = int(np.prod(shape))
+    dtype = index_dtype(N)
+    
+    strides = np.cumprod((1,) + shape[:0:-1])[::-1]
+    nodes = np.arange(N, dtype=dtype)
+    
+    columns = []
+    for side, stride in zip(shape, strides):
+        coord = (nodes // stride) % side
+        for offset in range(1, reach + 1):
+            for step in (-offset, offset):
+                target = coord + step
+                if periodic:
+                    target %= side
+                    valid = np.ones(N, dtype=bool)
+                else:
+                    valid = (target >= 0) & (target < side)
+                neighbor = nodes + (target - coord) * stride
+                columns.append(np.where(valid, neighbor, N).astype(dtype))
+    
+    if not columns:
+        return CSRGraph(np.zeros(N + 1, dtype=dtype), np.zeros(0, dtype=dtype))
+    
+    neighbors = np.column_stack(columns)
+    neighbors.sort(axis=1)
+    
+    valid = (neighbors != N) & (neighbors != nodes[:, None])
+    valid[:, 1:] &= neighbors[:, 1:] != neighbors[:, :-1]
+    
+    indptr = np.zeros(N + 1, dtype=np.int64)
+    np.cumsum(valid.sum(axis=1), out=indptr[1:])
+    
+    return CSRGraph(indptr, neighbors[valid])
+
+
+def popcount(words):
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(words).sum(dtype=np.int64))
+    return int(_POPCOUNT[words.view(np.uint8)].sum(dtype=np.int64))
+
+
+def row_offsets(indptr, rows):
+    starts = indptr[rows].astype(np.int64)
+    counts = indptr[rows + 1] - starts
+    return np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum()), counts
+
+
+def distance_histogram(G, sources=None, max_bytes=1 << 26):
+    N = G.number_of_nodes()
+    sources = np.arange(N) if sources is None else np.asarray(sources)
+    
+    row_bytes = 8 * (len(G.indices) + 3 * N)
+    words = max(1, min(-(-len(sources) // 64), max_bytes // max(row_bytes, 1)))
+    visited = np.zeros(N * words, dtype=np.uint64)
+    pending = np.zeros(N * words, dtype=np.uint64)
+    slot = np.zeros(N * words, dtype=np.int64)
+    
+    counts = [0]
+    for chunk_start in range(0, len(sources), 64 * words):
+        chunk = sources[chunk_start:chunk_start + 64 * words].astype(np.int64)
+        bits = np.arange(len(chunk))
+        W = -(-len(chunk) // 64)
+        
+        keys = chunk * W + bits // 64
+        values = np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64))
+        touched = []
+        
+        level = 0
+        while len(keys):
+            np.bitwise_or.at(pending, keys, values)
+            slot[keys] = np.arange(len(keys))
+            keys = keys[slot[keys] == np.arange(len(keys))]
+            values = pending[keys] & ~visited[keys]
+            pending[keys] = 0
+            
+            keep = values != 0
+            keys, values = keys[keep], values[keep]
+            if len(keys) == 0:
+                break
+            visited[keys] |= values
+            touched.append(keys)
+            
+            if level == len(counts):
+                counts.append(0)
+            if level:
+                counts[level] += popcount(values)
+            level += 1
+            
+            offsets, degree = row_offsets(G.indptr, keys // W)
+            keys = G.indices[offsets].astype(np.int64) * W + np.repeat(keys % W, degree)
+            values = np.repeat(values, degree)
+        
+        for keys in touched:
+            visited[keys] = 0
+    
+    return np.array(counts, dtype=np.int64)
@@ -0,0 +1,222 @@
+import os
+import numpy as np
+
+from .cache import ArrayCache
+from .graph import CSRGraph
+
+
+LAYOUT_CACHE = ArrayCache(cache_dir=os.environ.get('SN_LAYOUT_CACHE'))
+
+EXACT_LIMIT = 512
+COARSEST_SIZE = 64
+
+_OFFSETS = np.array([(dx, dy) for dx in range(-2, 4) for dy in range(-2, 4)])
+_NEAR = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+
+
+def _graph_arrays(G):
+    if isinstance(G, CSRGraph):
+        rows = np.repeat(np.arange(G.number_of_nodes()), G.degree())
+        return G.node_list(), rows, G.indices.astype(np.int64)
+    
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges() if u != v], dtype=np.int64).reshape(-1, 2)
+    rows = np.concatenate([edges[:, 0], edges[:, 1]])
+    cols = np.concatenate([edges[:, 1], edges[:, 0]])
+    return nodes, rows, cols
+
+
+def _exact_repulsion(pos, mass, k):
+    delta = pos[:, None, :] - pos[None, :, :]
+    distance2 = np.maximum((delta ** 2).sum(axis=2), 1e-4 * k * k)
+    np.fill_diagonal(distance2, np.inf)
+    return k * k * (delta * (mass[None, :] / distance2)[:, :, None]).sum(axis=1)
+
+
+def _cell_moments(ids, mass, pos):
+    order = np.argsort(ids, kind='stable')
+    starts = np.flatnonzero(np.diff(ids[order], prepend=-1) != 0)
+    occupied = ids[order][starts]
+    
+    slot = np.empty(len(ids), dtype=np.int64)
+    slot[order] = np.cumsum(np.diff(ids[order], prepend=-1) != 0) - 1
+    
+    m = np.bincount(slot, mass, len(occupied))
+    center = np.column_stack([np.bincount(slot, mass * pos[:, 0], len(occupied)),
+                              np.bincount(slot, mass * pos[:, 1], len(occupied))]) / m[:, None]
+    count = np.bincount(slot, minlength=len(occupied))
+    
+    return occupied, slot, m, center, count
+
+
+def _find_cells(occupied, x, y, side):
+    valid = (x >= 0) & (x < side) & (y >= 0) & (y < side)
+    position = np.minimum(np.searchsorted(occupied, x * side + y), len(occupied) - 1)
+    valid &= occupied[position] == x * side + y
+    return position, valid
+
+
+def _cell_field(points, source, valid, m, center, k):
+    source_mass = np.where(valid, m[source], 0.0)
+    dx = points[:, :1] - center[source, 0]
+    dy = points[:, 1:] - center[source, 1]
+    r2 = np.maximum(dx * dx + dy * dy, 1e-4 * k * k)
+    return k * k * source_mass / r2, dx, dy, r2
+
+
+def _barnes_hut_repulsion(pos, mass, k, leaf_size=4, max_levels=20):
+    n = len(pos)
+    
+    low = pos.min(axis=0)
+    span = max(float((pos.max(axis=0) - low).max()), 1e-9) * (1 + 1e-9)
+    unit = (pos - low) / span
+    
+    force = np.zeros_like(pos)
+    level = 1
+    while True:
+        level += 1
+        side = 1 << level
+        cell = np.minimum((unit * side).astype(np.int64), side - 1)
+        occupied, slot, m, center, count = _cell_moments(cell[:, 0] * side + cell[:, 1], mass, pos)
+        cell_x, cell_y = occupied // side, occupied % side
+        
+        x = 2 * (cell_x // 2)[:, None] + _OFFSETS[None, :, 0]
+        y = 2 * (cell_y // 2)[:, None] + _OFFSETS[None, :, 1]
+        source, valid = _find_cells(occupied, x, y, side)
+        valid &= (np.abs(x - cell_x[:, None]) > 1) | (np.abs(y - cell_y[:, None]) > 1)
+        
+        scale, dx, dy, r2 = _cell_field(center, source, valid, m, center, k)
+        curvature = 2 * scale / r2
+        field = np.column_stack([(scale * dx).sum(axis=1), (scale * dy).sum(axis=1)])
+        jxx = (scale - curvature * dx * dx).sum(axis=1)
+        jxy = (-curvature * dx * dy).sum(axis=1)
+        jyy = (scale - curvature * dy * dy).sum(axis=1)
+        
+        offset = pos - center[slot]
+        force[:, 0] += field[slot, 0] + jxx[slot] * offset[:, 0] + jxy[slot] * offset[:, 1]
+        force[:, 1] += field[slot, 1] + jxy[slot] * offset[:, 0] + jyy[slot] * offset[:, 1]
+        
+        if (4 ** level >= n and count.max() <= leaf_size) or level >= max_levels:
+            break
+    
+    x = cell[:, :1] + _NEAR[None, :, 0]
+    y = cell[:, 1:] + _NEAR[None, :, 1]
+    source, valid = _find_cells(occupied, x, y, side)
+    
+    scale, dx, dy, r2 = _cell_field(pos, source, valid, m, center, k)
+    own = valid & (source == slot[:, None])
+    others = m[slot] - mass
+    shift = np.where(others > 1e-12, mass / np.where(others > 1e-12, others, 1.0), 0.0)
+    own_dx = (1 + shift)[:, None] * dx
+    own_dy = (1 + shift)[:, None] * dy
+    own_scale = k * k * others[:, None] / np.maximum(own_dx ** 2 + own_dy ** 2, 1e-4 * k * k)
+    
+    scale = np.where(own, own_scale, scale)
+    dx = np.where(own, own_dx, dx)
+    dy = np.where(own, own_dy, dy)
+    force[:, 0] += (scale * dx).sum(axis=1)
+    force[:, 1] += (scale * dy).sum(axis=1)
+    
+    return force
+
+
+def _force_directed(pos, mass, rows, cols, weights, k, iterations, temperature):
+    n = len(pos)
+    cooling = temperature / (iterations + 1)
+    
+    for iteration in range(iterations):
+        if n <= EXACT_LIMIT:
+            displacement = _exact_repulsion(pos, mass, k)
+        else:
+            displacement = _barnes_hut_repulsion(pos, mass, k)
+        
+        delta = pos[rows] - pos[cols]
+        length = np.sqrt((delta ** 2).sum(axis=1))
+        pull = (weights * length / k)[:, None] * delta
+        displacement[:, 0] -= np.bincount(rows, pull[:, 0], n)
+        displacement[:, 1] -= np.bincount(rows, pull[:, 1], n)
+        
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-12)
+        pos += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+    
+    return pos
+
+
+def _coarsen(n, rows, cols, weights, mass, rng):
+    priority = rng.permutation(n)
+    best = priority.copy()
+    np.maximum.at(best, rows, priority[cols])
+    
+    leader = np.argsort(priority)[best]
+    present = np.zeros(n, dtype=np.int64)
+    present[leader] = 1
+    labels = (np.cumsum(present) - 1)[leader]
+    size = int(labels.max()) + 1 if n else 0
+    
+    u, v = labels[rows], labels[cols]
+    keep = u != v
+    keys = u[keep] * size + v[keep]
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    starts = np.flatnonzero(np.diff(keys, prepend=-1) != 0)
+    
+    coarse_weights = np.add.reduceat(weights[keep][order], starts) if len(keys) else np.zeros(0)
+    coarse_rows, coarse_cols = np.divmod(keys[starts], size)
+    
+    return labels, size, coarse_rows, coarse_cols, coarse_weights, np.bincount(labels, mass, size)
+
+
+def force_directed_layout(G, k=None, iterations=50, seed=None):
+    rng = np.random.default_rng(seed)
+    nodes, rows, cols = _graph_arrays(G)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: np.zeros(2)}
+    
+    k = 1 / np.sqrt(n) if k is None else k
+    hierarchy = [(n, rows, cols, np.ones(len(rows)), np.ones(n))]
+    while hierarchy[-1][0] > COARSEST_SIZE and n > EXACT_LIMIT:
+        size, r, c, w, m = hierarchy[-1]
+        labels, coarse_size, *coarse = _coarsen(size, r, c, w, m, rng)
+        if coarse_size > 0.8 * size:
+            break
+        hierarchy[-1] = hierarchy[-1] + (labels,)
+        hierarchy.append((coarse_size, *coarse))
+    
+    size = hierarchy[-1][0]
+    extent = max(1.0, k * np.sqrt(n))
+    pos = extent * rng.random((size, 2))
+    for depth in range(len(hierarchy) - 1, -1, -1):
+        size, r, c, w, m = hierarchy[depth][:5]
+        level_k = k * np.sqrt(n / size)
+        if depth < len(hierarchy) - 1:
+            pos = pos[hierarchy[depth][5]] + level_k * 0.1 * rng.standard_normal((size, 2))
+            temperature = 2 * level_k
+            steps = max(10, iterations // 2)
+        else:
+            temperature = 0.1 * extent
+            steps = iterations
+        pos = _force_directed(pos, m, r, c, w, level_k, steps, temperature)
+    
+    pos -= pos.mean(axis=0)
+    scale = np.abs(pos).max()
+    if scale > 0:
+        pos /= scale
+    
+    return dict(zip(nodes, pos))
+
+
+def cached_layout(G, k=None, iterations=50, seed=42, cache=None):
+    cache = LAYOUT_CACHE if cache is None else cache
+    nodes = G.node_list() if isinstance(G, CSRGraph) else list(G.nodes())
+    key = cache.key(G, kind='layout', k=k, iterations=iterations, seed=seed)
+    
+    def compute():
+        layout = force_directed_layout(G, k=k, iterations=iterations, seed=seed)
+        return np.array([layout[node] for node in nodes]).reshape(-1, 2)
+    
+    return dict(zip(nodes, cache.get_or_compute(key, compute)))